@@ -50,6 +50,11 @@ class ChangeoverConstraint(Constraint):
             return False
         return prev_key != next_key
 
+    def applies_to_resource_type(self, resource_type: str) -> bool:
+        if self.changeover_seconds <= 0:
+            return False
+        return not self.resource_type_filter or resource_type in self.resource_type_filter
+
     def is_feasible(self, schedule, operation, resource, start_ts: float, end_ts: float) -> bool:
         if self.changeover_seconds <= 0 or not resource.schedule:
             return True
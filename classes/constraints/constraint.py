@@ -8,9 +8,21 @@ class Constraint:
     Base class for scheduling constraints.
 
     Override is_feasible to enforce hard constraints. Optionally override
-    adjust_earliest_start to push a proposed start time forward.
+    adjust_earliest_start to push a proposed start time forward,
+    next_candidate_start to tell the slot search how far a rejected start can skip,
+    and applies_to_resource_type to let the schedule skip the constraint entirely
+    for resource types it never restricts.
     """
 
+    def applies_to_resource_type(self, resource_type: str) -> bool:
+        """
+        Whether this constraint can ever reject or shift a slot on this resource type.
+
+        Schedule caches the answer per resource type when the constraint is added,
+        so it should only depend on settings fixed at construction.
+        """
+        return True
+
     def is_feasible(self, schedule, operation, resource, start_ts: float, end_ts: float) -> bool:
         return True
 
@@ -19,5 +31,16 @@ class Constraint:
     ) -> float:
         return earliest_start
 
+    def next_candidate_start(
+        self, schedule, operation, resource, start_ts: float, end_ts: float
+    ) -> float:
+        """
+        Earliest start worth retrying after is_feasible rejected [start_ts, end_ts).
+
+        Must not skip any start that could be feasible for the same duration. The
+        default makes no claim and steps one second forward.
+        """
+        return start_ts + 1
+
     def __repr__(self) -> str:
         return self.__class__.__name__
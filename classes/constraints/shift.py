@@ -2,7 +2,7 @@
 Shift constraint.
 """
 
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
 from .constraint import Constraint
@@ -35,6 +35,9 @@ class ShiftConstraint(Constraint):
         self.shift_windows = shift_windows
         self.mode = mode
         self.resource_type_filter = resource_type_filter
+        # Per-day window bounds as timestamps, so feasibility checks compare floats
+        # instead of building datetimes on every call.
+        self._window_timestamps_by_day = {}
 
     def _get_shift_windows_for_day(self, dt: datetime) -> list:
         """
@@ -59,6 +62,19 @@ class ShiftConstraint(Constraint):
                 windows.append((prev_start_dt, prev_end_dt))
         return windows
 
+    def _get_shift_window_timestamps(self, day: date) -> tuple:
+        """
+        Same windows as _get_shift_windows_for_day, as (start_ts, end_ts) floats.
+        """
+        windows = self._window_timestamps_by_day.get(day)
+        if windows is None:
+            windows = tuple(
+                (start_dt.timestamp(), end_dt.timestamp())
+                for start_dt, end_dt in self._get_shift_windows_for_day(datetime.combine(day, time()))
+            )
+            self._window_timestamps_by_day[day] = windows
+        return windows
+
     def _is_in_shift(self, dt: datetime) -> bool:
         return any(start <= dt < end for start, end in self._get_shift_windows_for_day(dt))
 
@@ -72,24 +88,43 @@ class ShiftConstraint(Constraint):
         next_windows = self._get_shift_windows_for_day(next_day)
         return min(start for start, _ in next_windows)
 
+    def applies_to_resource_type(self, resource_type: str) -> bool:
+        if self.mode == "ignore":
+            return False
+        return not self.resource_type_filter or resource_type in self.resource_type_filter
+
     def is_feasible(self, schedule, operation, resource, start_ts: float, end_ts: float) -> bool:
         if self.mode == "ignore":
             return True
         if self.resource_type_filter and resource.resource_type not in self.resource_type_filter:
             return True
 
-        start_dt = datetime.fromtimestamp(start_ts)
-        end_dt = datetime.fromtimestamp(end_ts)
+        windows = self._get_shift_window_timestamps(datetime.fromtimestamp(start_ts).date())
 
         if self.mode == "allow_overrun":
-            return self._is_in_shift(start_dt)
+            return any(shift_start <= start_ts < shift_end for shift_start, shift_end in windows)
 
         # strict mode: must fit within any single window
-        for shift_start, shift_end in self._get_shift_windows_for_day(start_dt):
-            if shift_start <= start_dt and end_dt <= shift_end:
+        for shift_start, shift_end in windows:
+            if shift_start <= start_ts and end_ts <= shift_end:
                 return True
         return False
 
+    def next_candidate_start(
+        self, schedule, operation, resource, start_ts: float, end_ts: float
+    ) -> float:
+        # allow_overrun rejects starts outside every window. strict rejects when no
+        # window opened by start_dt holds the whole interval, and a later start in
+        # those windows only ends later. Either way nothing before the next window
+        # start can pass.
+        start_day = datetime.fromtimestamp(start_ts).date()
+        return min(
+            window_start
+            for day in (start_day, start_day + timedelta(days=1))
+            for window_start, _ in self._get_shift_window_timestamps(day)
+            if window_start > start_ts
+        )
+
     def adjust_earliest_start(self, schedule, operation, resource, earliest_start: float) -> float:
         if self.mode == "ignore":
             return earliest_start
@@ -97,6 +132,7 @@ class ShiftConstraint(Constraint):
             return earliest_start
 
         dt = datetime.fromtimestamp(earliest_start)
-        if self._is_in_shift(dt):
+        windows = self._get_shift_window_timestamps(dt.date())
+        if any(shift_start <= earliest_start < shift_end for shift_start, shift_end in windows):
             return earliest_start
         return self._next_shift_start(dt).timestamp()
@@ -24,11 +24,15 @@ class Job:
         operations (List[Operation]): List of operations that make up this job
         metadata (dict): Optional dictionary for storing additional job information
                         (e.g., {'customer': 'ABC Corp', 'priority': 'high', 'due_date': datetime})
+
+    Instances use ``__slots__``; free-form data belongs in ``metadata``.
     
     Example:
         >>> operations = [Operation(...), Operation(...)]
         >>> job = Job("JOB_001", operations, {"customer": "ABC Corp", "priority": "high"})
     """
+
+    __slots__ = ("job_id", "operations", "metadata")
     
     def __init__(self, job_id: str, operations: List["Operation"], metadata: Optional[dict] = None):
         """
@@ -25,12 +25,20 @@ class Operation:
         possible_resource_ids (List[str]): List of specific resources (single-resource mode)
         resource_requirements (List[Dict[str, List[str]]]): Multi-resource requirements list
             with entries like {"resource_type": "site", "possible_resource_ids": ["SITE_1", "SITE_2"]}
+        resource_options (Dict[str, List[str]]): Candidate resource IDs per resource type
+            (e.g. resource_options["site"]), taken from the first matching requirement.
+            Built once at construction, so requirements are treated as fixed afterwards
         precedence (List[str]): List of operation IDs that must complete before this one
         metadata (dict): Optional dictionary for additional operation information
         start_time (float): Scheduled start time as Unix timestamp (None if unscheduled)
         end_time (float): Scheduled end time as Unix timestamp (None if unscheduled)
         resource_id (str): Primary resource ID (single-resource mode or first assigned)
         assigned_resources (dict): Mapping of resource_type -> resource_id(s)
+
+    Instances use ``__slots__``. Besides the fields above, slots are reserved for
+    values that ranking and dispatch code derives per operation (priority bucket,
+    ranks and scores); they stay unset until written, and free-form data belongs
+    in ``metadata``.
     
     Example:
         >>> op = Operation(
@@ -43,6 +51,34 @@ class Operation:
         ...     metadata={"description": "Machine part A"}
         ... )
     """
+
+    __slots__ = (
+        "operation_id",
+        "job_id",
+        "duration",
+        "resource_type",
+        "possible_resource_ids",
+        "resource_requirements",
+        "resource_options",
+        "precedence",
+        "metadata",
+        "start_time",
+        "end_time",
+        "resource_id",
+        "assigned_resources",
+        # Derived ranking/dispatch values (set by priority passes, unset by default)
+        "priority_bucket",
+        "base_importance",
+        "clipped_duration_hours",
+        "possible_site_idx",
+        "priority_rank",
+        "priority_score",
+        "avg_site_importance",
+        "site_options",
+        "base_priority_score",
+        "effective_priority_score",
+        "unlocked_descendants",
+    )
     
     def __init__(
         self,
@@ -82,6 +118,11 @@ class Operation:
         self.resource_type = resource_type  # e.g., "machining", "assembly", "painting"
         self.possible_resource_ids = possible_resource_ids or []
         self.resource_requirements = resource_requirements
+        # Precomputed so callers read e.g. resource_options["site"] instead of
+        # scanning the requirement dicts each time.
+        self.resource_options = {}
+        for req in self.get_resource_requirements():
+            self.resource_options.setdefault(req.get("resource_type"), req.get("possible_resource_ids", []))
         self.precedence = precedence or []  # Operations that must complete first
         self.metadata = metadata or {}
         self.start_time = start_time
@@ -10,6 +10,23 @@ from typing import Optional, List, Tuple
 from classes.operation import Operation
 
 
+class _StartTimeProbe:
+    """
+    Minimal stand-in for an Operation when bisecting a resource schedule by start time.
+
+    Orders the same way as Operation.__lt__ but avoids building a full Operation
+    for every lookup.
+    """
+
+    __slots__ = ("start_time",)
+
+    def __init__(self, start_time: float):
+        self.start_time = start_time
+
+    def __lt__(self, other):
+        return other.start_time is None or self.start_time < other.start_time
+
+
 class Resource:
     """
     Represents a resource that can perform operations.
@@ -27,6 +44,10 @@ class Resource:
             is available, represented as (start_timestamp, end_timestamp) tuples
         schedule (SortedList): Ordered list of operations scheduled on this resource,
             automatically sorted by start_time for efficient conflict detection
+        busy_seconds (float): Total duration of the operations in ``schedule``, kept
+            up to date by add/remove/clear so utilization queries avoid a rescan
+
+    Instances use ``__slots__``, so only the attributes above can be set.
     
     Example:
         >>> # Create a machine that works 8 AM to 5 PM
@@ -39,6 +60,15 @@ class Resource:
         ...     availability_windows=[(work_start, work_end)]
         ... )
     """
+
+    __slots__ = (
+        "resource_id",
+        "resource_type",
+        "resource_name",
+        "availability_windows",
+        "schedule",
+        "busy_seconds",
+    )
     
     def __init__(
         self,
@@ -63,6 +93,7 @@ class Resource:
         self.availability_windows = availability_windows or []
         # SortedList maintains operations in chronological order for efficient conflict detection
         self.schedule = SortedList()
+        self.busy_seconds = 0.0
 
     def is_available(self, start: float, end: float) -> bool:
         """
@@ -99,10 +130,8 @@ class Resource:
         if not self.schedule:
             return True
 
-        # Use binary search to find potential overlapping operations
-        # Create a dummy operation to find where this time slot would fit in the schedule
-        dummy_op = Operation("dummy", "dummy", 0, self.resource_type, start_time=start, end_time=end)
-        pos = self.schedule.bisect_left(dummy_op)
+        # Use binary search to find where this time slot would fit in the schedule
+        pos = self.bisect_start(start)
 
         # Check the operation immediately before the insertion point
         # If it ends after our start time, there's an overlap
@@ -121,6 +150,21 @@ class Resource:
         # No conflicts found
         return True
 
+    def bisect_start(self, start: float) -> int:
+        """
+        Index of the first scheduled operation starting at or after `start`.
+
+        Operations before the returned index start strictly before `start`.
+        Runs in O(log n) on the sorted schedule.
+
+        Args:
+            start: Unix timestamp to locate
+
+        Returns:
+            int: Insertion index in self.schedule
+        """
+        return self.schedule.bisect_left(_StartTimeProbe(start))
+
     def add_operation(self, operation: Operation) -> bool:
         """
         Add an operation to this resource's schedule.
@@ -171,6 +215,7 @@ class Resource:
 
         # Add to schedule (SortedList automatically maintains sort order)
         self.schedule.add(operation)
+        self.busy_seconds += operation.end_time - operation.start_time
         return True
 
     def remove_operation(self, operation: Operation):
@@ -187,7 +232,9 @@ class Resource:
         Example:
             >>> resource.remove_operation(operation)
         """
-        self.schedule.discard(operation)
+        if operation in self.schedule:
+            self.schedule.remove(operation)
+            self.busy_seconds -= operation.end_time - operation.start_time
     
     def get_operation_at(self, time: float) -> Optional[Operation]:
         """
@@ -301,6 +348,14 @@ class Resource:
             return 0.0
         
         total_time = end - start
+        if not self.schedule:
+            return 0.0
+
+        # Scheduled operations never overlap, so when the first starts and the last
+        # ends inside the range, every operation is fully covered by it.
+        if self.schedule[0].start_time >= start and self.schedule[-1].end_time <= end:
+            return self.busy_seconds / total_time
+
         busy_time = 0.0
         
         for op in self.schedule:
@@ -373,6 +428,7 @@ class Resource:
             >>> assert len(resource.schedule) == 0
         """
         self.schedule.clear()
+        self.busy_seconds = 0.0
     
     def get_total_scheduled_time(self) -> float:
         """
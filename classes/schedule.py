@@ -6,21 +6,18 @@ and provides methods for scheduling operations and visualizing the results.
 """
 
 from datetime import datetime, timedelta, time
-from typing import Dict, Optional, List, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, List, TYPE_CHECKING
+import importlib.util
 import itertools
+from operator import attrgetter
 if TYPE_CHECKING:
     from classes.constraints import Constraint
     from classes.duration_policy import DurationAdjustmentPolicy
 
-# Optional matplotlib imports for visual charts
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.patches import Rectangle
-    import numpy as np
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib is optional and only needed for visual charts. Probe for it here
+# but defer the (slow) import until show_visual_gantt_chart() is called, so
+# headless runs don't pay for it.
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
 
 
 class Schedule:
@@ -80,6 +77,9 @@ class Schedule:
         self.resources: Dict[str, "Resource"] = {}
         self.operations: Dict[str, "Operation"] = {}
         self.constraints: List["Constraint"] = []
+        # Constraints that apply to each resource type, filled lazily by
+        # _constraints_for and reset whenever the constraint list changes.
+        self._constraints_by_resource_type: Dict[str, tuple] = {}
         self.duration_adjustment_policy = duration_adjustment_policy
 
     def set_duration_adjustment_policy(
@@ -156,31 +156,75 @@ class Schedule:
         """
         self.resources[resource.resource_id] = resource
 
+    def add_resources(self, resources: Iterable["Resource"]):
+        """
+        Add several resources to the schedule in one call.
+
+        Args:
+            resources: The resources to add, in registration order
+
+        Example:
+            >>> schedule.add_resources(chain(sites, vehicles))
+        """
+        self.resources.update((resource.resource_id, resource) for resource in resources)
+
     def add_constraint(self, constraint: "Constraint"):
         """
         Add a scheduling constraint.
         """
         self.constraints.append(constraint)
+        self._constraints_by_resource_type.clear()
 
     def clear_constraints(self):
         """
         Remove all scheduling constraints.
         """
         self.constraints.clear()
+        self._constraints_by_resource_type.clear()
+
+    def _constraints_for(self, resource: "Resource") -> tuple:
+        """
+        Constraints that can affect slots on this resource's type.
+
+        Slot searches call the constraint hooks many times per operation; dropping
+        constraints whose filters never match the resource type avoids calls that
+        would only return early.
+        """
+        constraints = self._constraints_by_resource_type.get(resource.resource_type)
+        if constraints is None:
+            constraints = tuple(
+                constraint
+                for constraint in self.constraints
+                if constraint.applies_to_resource_type(resource.resource_type)
+            )
+            self._constraints_by_resource_type[resource.resource_type] = constraints
+        return constraints
 
     def _constraints_allow(
         self, operation: "Operation", resource: "Resource", start_ts: float, end_ts: float
     ) -> bool:
-        for constraint in self.constraints:
+        for constraint in self._constraints_for(resource):
             if not constraint.is_feasible(self, operation, resource, start_ts, end_ts):
                 return False
         return True
 
+    def _constraints_next_start(
+        self, operation: "Operation", resource: "Resource", start_ts: float, end_ts: float
+    ) -> Optional[float]:
+        """
+        Return None if every constraint allows the interval, otherwise the first
+        rejecting constraint's next_candidate_start.
+        """
+        for constraint in self._constraints_for(resource):
+            if not constraint.is_feasible(self, operation, resource, start_ts, end_ts):
+                return constraint.next_candidate_start(self, operation, resource, start_ts, end_ts)
+        return None
+
     def _apply_constraints_earliest_start(
         self, operation: "Operation", resource: "Resource", earliest_start: float
     ) -> float:
         adjusted = earliest_start
-        for constraint in self.constraints:
+        for constraint in self._constraints_for(resource):
             adjusted = max(
                 adjusted, constraint.adjust_earliest_start(self, operation, resource, adjusted)
             )
@@ -309,15 +353,11 @@ class Schedule:
                         f"No availability window can fit duration on {resource.resource_id}"
                     )
 
-            # Find previous and next operations around time t
-            prev_op = None
-            next_op = None
-            for scheduled_op in resource.schedule:
-                if scheduled_op.start_time < t:
-                    prev_op = scheduled_op
-                    continue
-                next_op = scheduled_op
-                break
+            # Find previous and next operations around time t by binary search
+            booked = resource.schedule
+            pos = resource.bisect_start(t)
+            prev_op = booked[pos - 1] if pos > 0 else None
+            next_op = booked[pos] if pos < len(booked) else None
 
             # Overlap with previous operation
             if prev_op and prev_op.end_time > t:
@@ -330,8 +370,9 @@ class Schedule:
                     t = next_op.end_time
                     continue
 
-            if operation and not self._constraints_allow(operation, resource, t, t + duration):
-                adjusted = self._apply_constraints_earliest_start(operation, resource, t + 1)
+            retry = self._constraints_next_start(operation, resource, t, t + duration) if operation else None
+            if retry is not None:
+                adjusted = self._apply_constraints_earliest_start(operation, resource, retry)
                 if adjusted <= t:
                     adjusted = t + 1
                 t = adjusted
@@ -407,10 +448,17 @@ class Schedule:
                 elapsed += effective_duration
             return job
 
+        # End times of this job's operations as they are placed, so predecessor
+        # lookups inside the job skip the schedule-wide operations dict.
+        end_time_of = {}
         for op in job.operations:
             earliest = earliest_start
-            if op.precedence:
-                earliest = max(earliest, max(self.operations[p].end_time for p in op.precedence))
+            for pred_id in op.precedence:
+                pred_end = end_time_of.get(pred_id)
+                if pred_end is None:
+                    pred_end = self.operations[pred_id].end_time
+                if pred_end > earliest:
+                    earliest = pred_end
             start_ts, assigned_resources = self._find_earliest_slot_any_resource(op, earliest)
             scheduled = self.schedule_operation_multi(
                 op.operation_id,
@@ -419,6 +467,7 @@ class Schedule:
             )
             if not scheduled:
                 raise RuntimeError(f"Failed to schedule {op.operation_id} at {start_ts}")
+            end_time_of[op.operation_id] = op.end_time
 
         return job
 
@@ -542,6 +591,25 @@ class Schedule:
         """
         Schedule an operation that requires multiple resources at the same time.
         """
+        return self.schedule_operation_multi_ts(operation_id, assigned_resources, start_time.timestamp())
+
+    def schedule_operation_multi_ts(
+        self, operation_id: str, assigned_resources: dict, start_ts: float
+    ) -> bool:
+        """
+        Same as schedule_operation_multi, but takes the start as a Unix timestamp.
+
+        Internally all scheduling is done on timestamps, so callers that already hold
+        one (e.g. from _find_earliest_slot_any_resource) can skip the datetime round-trip.
+
+        Args:
+            operation_id: ID of the operation to schedule
+            assigned_resources: Mapping of resource_type -> resource_id (or list of ids)
+            start_ts: Start time as a Unix timestamp (seconds)
+
+        Returns:
+            bool: True if scheduling succeeded, False otherwise
+        """
         if operation_id not in self.operations:
             raise KeyError(f"Operation {operation_id} not found")
 
@@ -584,8 +652,7 @@ class Schedule:
                 raise ValueError(f"Resource {resource_id} is not allowed for operation {operation_id}")
             resources.append(resource)
 
-        # Convert datetime to timestamp for internal calculations
-        start_timestamp = start_time.timestamp()
+        start_timestamp = start_ts
         proposed_assigned_resources = self._build_assigned_resources(requirements, assignment_ids)
         end_timestamp = start_timestamp + self._get_effective_duration(op, proposed_assigned_resources)
 
@@ -1117,7 +1184,7 @@ class Schedule:
             return
         
         # Sort chronologically for display
-        all_operations.sort(key=lambda op: op.start_time)
+        all_operations.sort(key=attrgetter("start_time"))
         
         # Determine the time range covered by the schedule
         earliest_start = min(op.start_time for op in all_operations)
@@ -1146,7 +1213,7 @@ class Schedule:
             print(f"{job_id} ({customer} - {priority} priority):")
             
             operations = jobs_operations[job_id]
-            operations.sort(key=lambda op: op.start_time)
+            operations.sort(key=attrgetter("start_time"))
             
             for operation in operations:
                 start_dt = datetime.fromtimestamp(operation.start_time)
@@ -1201,6 +1268,9 @@ class Schedule:
         if not MATPLOTLIB_AVAILABLE:
             print("Error: matplotlib is required for visual Gantt charts. Install with: pip install matplotlib")
             return
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        from matplotlib.patches import Rectangle
         
         # Filter resources if requested
         resources = list(self.resources.values())
@@ -1272,7 +1342,8 @@ class Schedule:
             changeover_constraints = []
 
         for resource in resources:
-            scheduled_ops = sorted(resource.schedule, key=lambda op: op.start_time)
+            # resource.schedule is a SortedList already ordered by start_time.
+            scheduled_ops = list(resource.schedule)
             if len(scheduled_ops) < 2:
                 continue
             for prev_op, next_op in zip(scheduled_ops, scheduled_ops[1:]):
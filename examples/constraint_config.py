@@ -12,6 +12,8 @@ SCHEDULE_CONFIG = {
     # - Draw a fresh subset for each run.
     # - Set random_test_seed for reproducible runs; keep None for new random samples.
     "random_test_pool_size": 500,
+    # Worker processes for pools larger than 1000 tests (generated in chunks).
+    "random_test_pool_workers": 1,
     "selected_test_count": 120,
     "random_test_seed": None,
 }
@@ -12,10 +12,13 @@ typical manufacturing scheduling problem.
 """
 
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import List
 import sys
 import os
 
+from sortedcontainers import SortedList
+
 # Add the classes directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'classes'))
 
@@ -243,17 +246,45 @@ def greedy_earliest_scheduler(schedule: Schedule) -> int:
     current_time = schedule.start_date
     scheduled_count = 0
     max_iterations = 200
+
+    # Track readiness incrementally instead of rescanning every operation each pass:
+    # waiting_on counts unscheduled predecessors, and an operation joins `ready`
+    # (kept in schedule order) once that count reaches zero. Operations with a
+    # missing predecessor never become ready, matching can_start_at.
+    operations = list(schedule.operations.values())
+    index_of = {op.operation_id: idx for idx, op in enumerate(operations)}
+    children = [[] for _ in operations]
+    waiting_on = [0] * len(operations)
+    ready = SortedList()
+    for idx, operation in enumerate(operations):
+        if operation.is_scheduled():
+            continue
+        for pred_id in operation.precedence:
+            pred_idx = index_of.get(pred_id)
+            if pred_idx is None:
+                waiting_on[idx] = float("inf")
+            elif not operations[pred_idx].is_scheduled():
+                waiting_on[idx] += 1
+                children[pred_idx].append(idx)
+        if waiting_on[idx] == 0:
+            ready.add(idx)
     
     while scheduled_count < len(schedule.operations) and max_iterations > 0:
         max_iterations -= 1
         progress_made = False
         
-        # Try to schedule each unscheduled operation
-        for op_id, operation in schedule.operations.items():
-            if operation.is_scheduled():
-                continue
+        # Try each ready operation in schedule order. Operations released during the
+        # pass are picked up if they come later in that order.
+        last_idx = -1
+        while True:
+            pos = ready.bisect_right(last_idx)
+            if pos == len(ready):
+                break
+            idx = last_idx = ready[pos]
+            operation = operations[idx]
+            op_id = operation.operation_id
             
-            # Check if operation can start now (precedence satisfied)
+            # Check if operation can start now (predecessors finished by current_time)
             if not operation.can_start_at(current_time.timestamp(), schedule.operations):
                 continue
             
@@ -263,6 +294,11 @@ def greedy_earliest_scheduler(schedule: Schedule) -> int:
                     scheduled_count += 1
                     progress_made = True
                     print(f"  [+] Scheduled {op_id} on {resource_id} at {current_time.strftime('%H:%M')}")
+                    ready.remove(idx)
+                    for child_idx in children[idx]:
+                        waiting_on[child_idx] -= 1
+                        if waiting_on[child_idx] == 0:
+                            ready.add(child_idx)
                     break
         
         # If no progress, advance time
@@ -305,6 +341,11 @@ def priority_based_scheduler(schedule: Schedule) -> int:
     )
     
     scheduled_count = 0
+    # End times of already-placed operations, keyed by operation_id. A dict lookup
+    # here replaces fetching each predecessor and calling is_scheduled() on it.
+    end_time_by_id = {
+        op_id: op.end_time for op_id, op in schedule.operations.items() if op.is_scheduled()
+    }
     
     for job in sorted_jobs:
         print(f"\n  Scheduling {job.job_id} (priority: {job.metadata.get('priority', 'medium')})")
@@ -313,7 +354,7 @@ def priority_based_scheduler(schedule: Schedule) -> int:
         ops_to_schedule = sorted(job.operations, key=lambda op: len(op.precedence))
         
         for operation in ops_to_schedule:
-            if operation.is_scheduled():
+            if operation.operation_id in end_time_by_id:
                 continue
             
             # Find earliest time this operation can start
@@ -321,9 +362,9 @@ def priority_based_scheduler(schedule: Schedule) -> int:
             
             # Check precedence - must start after predecessors complete
             for pred_id in operation.precedence:
-                pred_op = schedule.operations.get(pred_id)
-                if pred_op and pred_op.is_scheduled():
-                    earliest_start = max(earliest_start, pred_op.end_time)
+                pred_end = end_time_by_id.get(pred_id)
+                if pred_end is not None:
+                    earliest_start = max(earliest_start, pred_end)
             
             # Try to schedule on each possible resource
             best_time = None
@@ -343,6 +384,7 @@ def priority_based_scheduler(schedule: Schedule) -> int:
                 start_dt = datetime.fromtimestamp(best_time)
                 if schedule.schedule_operation(operation.operation_id, best_resource, start_dt):
                     scheduled_count += 1
+                    end_time_by_id[operation.operation_id] = operation.end_time
                     print(f"    [+] {operation.operation_id} on {best_resource} at {start_dt.strftime('%H:%M')}")
     
     print(f"\nScheduled {scheduled_count} out of {len(schedule.operations)} operations")
@@ -418,7 +460,7 @@ def analyze_schedule(schedule: Schedule):
     print("\n=== Schedule Flexibility Analysis ===")
     scheduled_ops = schedule.get_scheduled_operations()
     
-    for op_id, op in list(scheduled_ops.items())[:3]:  # Analyze first 3 for brevity
+    for op_id, op in islice(scheduled_ops.items(), 3):  # Analyze first 3 for brevity
         # Find alternative resources and times
         current_time = datetime.fromtimestamp(op.start_time)
         available = schedule.find_available_resources(op_id, current_time)
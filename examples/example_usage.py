@@ -195,19 +195,22 @@ def schedule_operations(schedule: Schedule):
     # Start scheduling from the beginning of the schedule period (Monday 8 AM)
     current_time = schedule.start_date
     
-    # Try to schedule all operations
+    # Try to schedule all operations. Pending operations are kept in a dict keyed by
+    # operation_id so placing one is an O(1) delete rather than a list scan.
     scheduled_count = 0
     max_attempts = 100  # Safety limit to prevent infinite loops
+    unscheduled = {
+        op_id: operation
+        for op_id, operation in schedule.operations.items()
+        if not operation.is_scheduled()
+    }
     
-    while scheduled_count < len(schedule.operations) and max_attempts > 0:
+    while unscheduled and max_attempts > 0:
         max_attempts -= 1
         initial_count = scheduled_count
         
         # Try to schedule each unscheduled operation
-        for op_id, operation in schedule.operations.items():
-            if operation.is_scheduled():
-                continue  # Skip already scheduled operations
-                
+        for op_id, operation in list(unscheduled.items()):
             # Try each possible resource for this operation
             for resource_id in operation.possible_resource_ids:
                 try:
@@ -215,6 +218,7 @@ def schedule_operations(schedule: Schedule):
                     # This will fail if resource is busy, precedence not met, etc.
                     if schedule.schedule_operation(op_id, resource_id, current_time):
                         scheduled_count += 1
+                        del unscheduled[op_id]
                         print(f"✓ Scheduled {op_id} on {resource_id} at {current_time}")
                         break  # Successfully scheduled, move to next operation
                 except (KeyError, ValueError) as e:
@@ -2,38 +2,234 @@
 Example: vehicle emissions testing plant (constraints exploration).
 """
 
-from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cached_property
+from operator import itemgetter
+import bisect
+import heapq
 import itertools
-from typing import Callable, Dict, Optional
+import math
+import multiprocessing
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
 import sys
 import os
 
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError("numpy is required for example_vehicle_testing.py") from exc
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from ortools.sat.python import cp_model
+    ORTOOLS_AVAILABLE = True
+except ImportError:
+    ORTOOLS_AVAILABLE = False
+
 # Ensure repo root is on the path so "classes" imports work
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from vehicle_testing_model import build_vehicle_testing_problem
+from classes.constraints import ChangeoverConstraint, ShiftConstraint
+from vehicle_testing_model import SITE, VEHICLE, build_vehicle_testing_problem
 from imitation_learning.policy import LinearCandidatePolicy
 
 
+@dataclass(frozen=True)
+class PrecedenceGraph:
+    """
+    Immutable CSR view of the precedence DAG, keyed by dense operation indices.
+
+    Operations are indexed in sorted operation_id order. The predecessors of
+    operation ``i`` are ``pred_indices[pred_indptr[i]:pred_indptr[i + 1]]`` and its
+    children are ``child_indices[child_indptr[i]:child_indptr[i + 1]]``. Edges to
+    operations outside the indexed set are dropped.
+    """
+
+    op_ids: Tuple[str, ...]
+    index_of: Dict[str, int]
+    pred_indptr: np.ndarray
+    pred_indices: np.ndarray
+    child_indptr: np.ndarray
+    child_indices: np.ndarray
+
+    def __len__(self):
+        return len(self.op_ids)
+
+    def children(self, idx):
+        return self.child_indices[self.child_indptr[idx]:self.child_indptr[idx + 1]]
+
+    def predecessors(self, idx):
+        return self.pred_indices[self.pred_indptr[idx]:self.pred_indptr[idx + 1]]
+
+    def align(self, tests):
+        """Return ``tests`` reordered so position ``i`` holds the operation with index ``i``."""
+        ops = [None] * len(self.op_ids)
+        for op in tests:
+            ops[self.index_of[op.operation_id]] = op
+        return ops
+
+    @cached_property
+    def reverse_topological_layers(self):
+        """
+        Operations grouped by height (longest path to a sink), sinks first.
+
+        Every child of an operation in layer ``h`` lives in a layer below ``h``, so
+        processing layers in order visits children before their predecessors.
+        Computed once per graph (Kahn's algorithm on out-degrees) and reused by
+        every strategy that shares the graph.
+
+        Raises:
+            ValueError: If the precedence graph contains a cycle
+        """
+        n = len(self.op_ids)
+        out_degree = np.diff(self.child_indptr)
+        frontier = np.flatnonzero(out_degree == 0)
+        layers = []
+        visited = 0
+        while frontier.size:
+            layers.append(frontier)
+            visited += frontier.size
+            preds, _ = _csr_gather(self.pred_indptr, self.pred_indices, frontier)
+            np.subtract.at(out_degree, preds, 1)
+            candidates = np.unique(preds)
+            frontier = candidates[out_degree[candidates] == 0]
+        if visited != n:
+            raise ValueError("Precedence graph contains a cycle")
+        return tuple(layers)
+
+    @cached_property
+    def descendant_counts(self):
+        """
+        Number of distinct transitive descendants of each operation (int array).
+
+        Built in one reverse topological sweep: each operation's descendant set is
+        the union of its children and their (already final) descendant sets. Sets
+        are int bitmasks (bit i = operation index i), so a union is a single OR.
+        """
+        child_indptr = self.child_indptr.tolist()
+        child_indices = self.child_indices.tolist()
+        descendants = [0] * len(self.op_ids)
+        for layer in self.reverse_topological_layers:
+            for idx in layer.tolist():
+                reached = 0
+                for child_idx in child_indices[child_indptr[idx]:child_indptr[idx + 1]]:
+                    reached |= (1 << child_idx) | descendants[child_idx]
+                descendants[idx] = reached
+        return np.fromiter(
+            (bin(reached).count("1") for reached in descendants), dtype=np.int64, count=len(descendants)
+        )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _propagate_effective_scores_jit(
+        base_scores, topo_order, child_indptr, child_indices, propagation_weight
+    ):
+        # Same recurrence as the layered NumPy path, one op at a time in reverse
+        # topological order: effective = max(base, weight * max(child effective)).
+        effective = base_scores.copy()
+        for idx in topo_order:
+            start = child_indptr[idx]
+            end = child_indptr[idx + 1]
+            if start == end:
+                continue
+            inherited = effective[child_indices[start]]
+            for pos in range(start + 1, end):
+                value = effective[child_indices[pos]]
+                if value > inherited:
+                    inherited = value
+            lifted = propagation_weight * inherited
+            if lifted > effective[idx]:
+                effective[idx] = lifted
+        return effective
+
+
+def _csr_gather(indptr, indices, rows):
+    """
+    Concatenate the CSR slices for ``rows``.
+
+    Returns the gathered indices and the start offset of each row's segment in the
+    gathered array (suitable for ``ufunc.reduceat`` when every row is non-empty).
+    """
+    counts = indptr[rows + 1] - indptr[rows]
+    starts = np.zeros(rows.size, dtype=np.int64)
+    if rows.size > 1:
+        np.cumsum(counts[:-1], out=starts[1:])
+    total = int(counts.sum())
+    positions = np.repeat(indptr[rows] - starts, counts) + np.arange(total)
+    return indices[positions], starts
+
+
+def _build_precedence_graph(tests):
+    """
+    Build the shared CSR precedence graph once for a set of operations.
+
+    The result only depends on operation ids and precedence lists, so it can be
+    reused across deep copies of the same schedule.
+    """
+    op_ids = tuple(sorted(op.operation_id for op in tests))
+    index_of = {op_id: idx for idx, op_id in enumerate(op_ids)}
+    n = len(op_ids)
+
+    pred_lists = [[] for _ in range(n)]
+    for op in tests:
+        idx = index_of[op.operation_id]
+        pred_lists[idx] = [index_of[pred_id] for pred_id in op.precedence if pred_id in index_of]
+
+    pred_counts = np.fromiter((len(preds) for preds in pred_lists), dtype=np.int32, count=n)
+    pred_indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(pred_counts, out=pred_indptr[1:])
+    pred_indices = np.fromiter(
+        itertools.chain.from_iterable(pred_lists), dtype=np.int32, count=int(pred_indptr[-1])
+    )
+
+    # Children CSR is the transpose: stable sort of edges by predecessor index.
+    edge_children = np.repeat(np.arange(n, dtype=np.int32), pred_counts)
+    order = np.argsort(pred_indices, kind="stable")
+    child_indices = edge_children[order]
+    child_indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(pred_indices, minlength=n), out=child_indptr[1:])
+
+    return PrecedenceGraph(
+        op_ids=op_ids,
+        index_of=index_of,
+        pred_indptr=pred_indptr,
+        pred_indices=pred_indices,
+        child_indptr=child_indptr,
+        child_indices=child_indices,
+    )
+
+
 def compute_priority_ranks_naive(tests):
     """
     Assign a unique global rank to each test (1 = highest priority).
     Uses existing 1-5 priority as the primary driver, then deterministic tie-breakers.
     """
-    ranked_tests = sorted(
-        tests,
-        key=lambda op: (
-            op.metadata.get("priority", 5),
-            op.duration,
-            op.operation_id,
-        ),
-    )
-    for rank, op in enumerate(ranked_tests, start=1):
-        op.metadata["priority_rank"] = rank
+    _ensure_priority_attributes(tests)
+    # Bucket sort on the handful of priority values, then order each bucket by the
+    # (duration, operation_id) tie-breakers.
+    buckets = defaultdict(list)
+    for op in tests:
+        buckets[op.priority_bucket].append((op.duration, op.operation_id, op))
+
+    ranked_tests = []
+    for priority_bucket in sorted(buckets):
+        bucket = buckets[priority_bucket]
+        bucket.sort(key=itemgetter(0, 1))
+        ranked_tests.extend(op for _, _, op in bucket)
+    _assign_priority_ranks(ranked_tests)
 
 
 def compute_priority_ranks_site_demand(tests):
@@ -45,112 +241,136 @@ def compute_priority_ranks_site_demand(tests):
     - Compute average importance demand per site.
     - Increase test score when it can run on fewer sites.
     """
-    site_importance_values = defaultdict(list)
-    test_sites = {}
+    _ensure_priority_attributes(tests)
+    table = _build_test_table(tests)
+    site_avg_importance, avg_site_demand, scores = _score_site_demand(tests, table)
+    _write_ranking_fields(
+        tests,
+        {
+            "avg_site_importance": avg_site_demand.tolist(),
+            "site_options": table.site_options.tolist(),
+            "priority_score": scores.tolist(),
+            "priority_rank": _lexsorted_ranks((-scores,), table).tolist(),
+        },
+    )
+    return site_avg_importance
 
-    for op in tests:
-        base_priority = op.metadata.get("priority", 5)
-        base_importance = max(1.0, 6.0 - float(base_priority))
 
-        possible_sites = []
-        for req in op.resource_requirements:
-            if req.get("resource_type") == "site":
-                possible_sites = req.get("possible_resource_ids", [])
-                break
+# Site-demand scores only depend on each test's id, base importance and site
+# options, which are identical across the deep copies ranked by every comparison
+# run. A few recent results are kept, keyed by exactly those inputs.
+_SITE_DEMAND_CACHE = {}
+_SITE_DEMAND_CACHE_MAX = 8
 
-        test_sites[op.operation_id] = possible_sites
-        for site_id in possible_sites:
-            site_importance_values[site_id].append(base_importance)
 
-    site_avg_importance = {
-        site_id: (sum(values) / len(values))
-        for site_id, values in site_importance_values.items()
-        if values
-    }
+def _score_site_demand(tests, table):
+    """
+    Site-demand scores for tests, without writing or ranking anything.
 
-    for op in tests:
-        possible_sites = test_sites.get(op.operation_id, [])
-        flexibility_count = len(possible_sites) if possible_sites else 1
-        avg_site_demand = (
-            sum(site_avg_importance.get(site_id, 0.0) for site_id in possible_sites) / flexibility_count
-            if possible_sites
-            else 0.0
-        )
-        flexibility_weight = 1.0 / flexibility_count
-        weighted_priority_score = avg_site_demand * (1.0 + flexibility_weight)
+    Strategies that build on the site-demand score call this and write their own
+    fields in one pass. table is the TestTable for tests.
+    Returns (site_avg_importance, avg site demand array, score array), arrays
+    aligned with tests.
+    """
+    fingerprint = tuple(
+        (op.operation_id, op.base_importance, op.possible_site_idx.tobytes()) for op in tests
+    )
+    cached = _SITE_DEMAND_CACHE.get(fingerprint)
+    if cached is None:
+        cached = _compute_site_demand(tests, table)
+        if len(_SITE_DEMAND_CACHE) >= _SITE_DEMAND_CACHE_MAX:
+            del _SITE_DEMAND_CACHE[next(iter(_SITE_DEMAND_CACHE))]
+        _SITE_DEMAND_CACHE[fingerprint] = cached
+    site_avg_importance, avg_site_demand, weighted_priority_scores = cached
+    return dict(site_avg_importance), avg_site_demand.copy(), weighted_priority_scores.copy()
 
-        op.metadata["avg_site_importance"] = avg_site_demand
-        op.metadata["site_options"] = flexibility_count
-        op.metadata["priority_score"] = weighted_priority_score
 
-    ranked_tests = sorted(
-        tests,
-        key=lambda op: (
-            -op.metadata.get("priority_score", 0.0),
-            op.metadata.get("priority", 5),
-            op.duration,
-            op.operation_id,
-        ),
+def _compute_site_demand(tests, table):
+    """
+    Site-demand inputs for _score_site_demand.
+
+    Returns (site_avg_importance, avg site demand array, weighted score array),
+    arrays aligned with tests.
+    """
+    n = len(tests)
+    base_importance = table.base_importance
+
+    # Flatten the (test, site) options into parallel arrays of test index and
+    # interned site index.
+    site_idx_arrays = [op.possible_site_idx for op in tests]
+    option_counts = np.fromiter((idx.size for idx in site_idx_arrays), dtype=np.int64, count=n)
+    pair_ops = np.repeat(np.arange(n), option_counts)
+    pair_sites = (
+        np.concatenate(site_idx_arrays) if site_idx_arrays else np.empty(0, dtype=np.int32)
     )
-    for rank, op in enumerate(ranked_tests, start=1):
-        op.metadata["priority_rank"] = rank
 
-    return site_avg_importance
+    # Weighted bincount accumulates in pair order, matching the old sequential sums
+    # exactly; the interned site table is small, so these are short dense arrays.
+    num_sites = len(_SITE_IDS)
+    site_sums = np.bincount(pair_sites, weights=base_importance[pair_ops], minlength=num_sites)
+    site_counts = np.bincount(pair_sites, minlength=num_sites)
+    site_avg = np.zeros(num_sites, dtype=np.float64)
+    np.divide(site_sums, site_counts, out=site_avg, where=site_counts > 0)
+
+    # Report only the sites these tests use, in first-seen order.
+    _, first_seen = np.unique(pair_sites, return_index=True)
+    used_sites = pair_sites[np.sort(first_seen)].tolist()
+    site_avg_importance = {_SITE_IDS[site_idx]: float(site_avg[site_idx]) for site_idx in used_sites}
+
+    flexibility_counts = table.site_options
+    site_demand_sums = np.bincount(pair_ops, weights=site_avg[pair_sites], minlength=n)
+    avg_site_demand = site_demand_sums / flexibility_counts
+    weighted_priority_scores = avg_site_demand * (1.0 + 1.0 / flexibility_counts)
 
+    return site_avg_importance, avg_site_demand, weighted_priority_scores
 
-def compute_priority_ranks_site_demand_with_precedence(tests, propagation_weight=0.85):
+
+def compute_priority_ranks_site_demand_with_precedence(tests, propagation_weight=0.85, graph=None):
     """
     Assign unique ranks using site-demand + flexibility, then propagate urgency backward
     across precedence edges so critical descendants pull predecessors earlier.
 
     propagation_weight controls how much downstream urgency is inherited.
+    graph is an optional prebuilt PrecedenceGraph for the same operation ids.
     """
-    site_avg_importance = compute_priority_ranks_site_demand(tests)
-    op_by_id = {op.operation_id: op for op in tests}
-
-    for op in tests:
-        op.metadata["base_priority_score"] = op.metadata.get("priority_score", 0.0)
-        op.metadata["effective_priority_score"] = op.metadata["base_priority_score"]
-
-    # Reverse edges: predecessor -> list of children
-    children_by_op = defaultdict(list)
-    for op in tests:
-        for pred_id in op.precedence:
-            if pred_id in op_by_id:
-                children_by_op[pred_id].append(op.operation_id)
-
-    # Fixed-point propagation in reverse topological spirit.
-    # A predecessor gets lifted if it unlocks high-urgency descendants.
-    for _ in range(len(tests)):
-        changed = False
-        for op in tests:
-            child_scores = [
-                op_by_id[child_id].metadata.get("effective_priority_score", 0.0)
-                for child_id in children_by_op.get(op.operation_id, [])
-            ]
-            inherited = max(child_scores) if child_scores else 0.0
-            new_effective = max(
-                op.metadata["base_priority_score"],
-                propagation_weight * inherited,
-            )
-            if abs(new_effective - op.metadata["effective_priority_score"]) > 1e-9:
-                op.metadata["effective_priority_score"] = new_effective
-                changed = True
-        if not changed:
-            break
-
-    ranked_tests = sorted(
-        tests,
-        key=lambda op: (
-            -op.metadata.get("effective_priority_score", 0.0),
-            -op.metadata.get("base_priority_score", 0.0),
-            op.metadata.get("priority", 5),
-            op.duration,
-            op.operation_id,
-        ),
+    _ensure_priority_attributes(tests)
+    if graph is None:
+        graph = _build_precedence_graph(tests)
+    ops = graph.align(tests)
+    table = _build_test_table(ops, ids_sorted=True)
+    site_avg_importance, avg_site_demand, base_scores = _score_site_demand(ops, table)
+
+    # Propagate in reverse topological order so every child is final before its
+    # predecessors read it. A predecessor gets lifted if it unlocks high-urgency
+    # descendants. Sinks (layer 0) simply keep their base score.
+    layers = graph.reverse_topological_layers
+    if NUMBA_AVAILABLE and layers:
+        effective_scores = _propagate_effective_scores_jit(
+            base_scores,
+            np.concatenate(layers),
+            graph.child_indptr,
+            graph.child_indices,
+            propagation_weight,
+        )
+    else:
+        effective_scores = base_scores.copy()
+        for layer in layers[1:]:
+            child_idx, starts = _csr_gather(graph.child_indptr, graph.child_indices, layer)
+            inherited = np.maximum.reduceat(effective_scores[child_idx], starts)
+            effective_scores[layer] = np.maximum(base_scores[layer], propagation_weight * inherited)
+
+    base_score_list = base_scores.tolist()
+    _write_ranking_fields(
+        ops,
+        {
+            "avg_site_importance": avg_site_demand.tolist(),
+            "site_options": table.site_options.tolist(),
+            "priority_score": base_score_list,
+            "base_priority_score": base_score_list,
+            "effective_priority_score": effective_scores.tolist(),
+            "priority_rank": _lexsorted_ranks((-effective_scores, -base_scores), table).tolist(),
+        },
     )
-    for rank, op in enumerate(ranked_tests, start=1):
-        op.metadata["priority_rank"] = rank
 
     return site_avg_importance
 
@@ -161,6 +381,7 @@ def compute_priority_ranks_importance_throughput(
     scarcity_weight=1.2,
     unlock_weight=0.45,
     short_test_bonus_weight=0.55,
+    graph=None,
 ):
     """
     Balance high-importance tests with throughput (getting many tests done).
@@ -170,63 +391,38 @@ def compute_priority_ranks_importance_throughput(
     - scarcity bonus for tests with fewer site options
     - unlock bonus for tests that unblock many descendants
     - short test bonus (value density) to improve test count throughput
-    """
-    op_by_id = {op.operation_id: op for op in tests}
-    children_by_op = defaultdict(list)
-    site_demand_map = compute_priority_ranks_site_demand(tests)
 
-    for op in tests:
-        for pred_id in op.precedence:
-            if pred_id in op_by_id:
-                children_by_op[pred_id].append(op.operation_id)
-
-    descendants_cache = {}
-
-    def count_descendants(op_id):
-        if op_id in descendants_cache:
-            return descendants_cache[op_id]
-        seen = set()
-        stack = list(children_by_op.get(op_id, []))
-        while stack:
-            child_id = stack.pop()
-            if child_id in seen:
-                continue
-            seen.add(child_id)
-            stack.extend(children_by_op.get(child_id, []))
-        descendants_cache[op_id] = len(seen)
-        return descendants_cache[op_id]
-
-    for op in tests:
-        base_priority = float(op.metadata.get("priority", 5))
-        base_importance = max(1.0, 6.0 - base_priority)
-        site_options = max(1, int(op.metadata.get("site_options", 1)))
-        scarcity_bonus = 1.0 / site_options
-        unlocked_count = count_descendants(op.operation_id)
-        duration_hours = max(op.duration / 3600.0, 0.25)
-        short_test_bonus = 1.0 / duration_hours
-
-        score = (
-            importance_weight * base_importance
-            + scarcity_weight * scarcity_bonus
-            + unlock_weight * unlocked_count
-            + short_test_bonus_weight * short_test_bonus
-        )
-
-        op.metadata["priority_score"] = score
-        op.metadata["importance_throughput_score"] = score
-        op.metadata["unlocked_descendants"] = unlocked_count
+    graph is an optional prebuilt PrecedenceGraph for the same operation ids.
+    """
+    _ensure_priority_attributes(tests)
+    if graph is None:
+        graph = _build_precedence_graph(tests)
+    ops = graph.align(tests)
+    table = _build_test_table(ops, ids_sorted=True)
+    site_demand_map, avg_site_demand, _ = _score_site_demand(ops, table)
+
+    unlocked_counts = graph.descendant_counts
+    scarcity_bonus = 1.0 / table.site_options
+    short_test_bonus = 1.0 / np.maximum(table.durations / 3600.0, 0.25)
+    scores = (
+        importance_weight * table.base_importance
+        + scarcity_weight * scarcity_bonus
+        + unlock_weight * unlocked_counts
+        + short_test_bonus_weight * short_test_bonus
+    )
 
-    ranked_tests = sorted(
-        tests,
-        key=lambda op: (
-            -op.metadata.get("importance_throughput_score", 0.0),
-            op.metadata.get("priority", 5),
-            op.duration,
-            op.operation_id,
-        ),
+    score_list = scores.tolist()
+    _write_ranking_fields(
+        ops,
+        {
+            "avg_site_importance": avg_site_demand.tolist(),
+            "site_options": table.site_options.tolist(),
+            "priority_score": score_list,
+            "unlocked_descendants": unlocked_counts.tolist(),
+            "priority_rank": _lexsorted_ranks((-scores,), table).tolist(),
+        },
+        metadata_only={"importance_throughput_score": score_list},
     )
-    for rank, op in enumerate(ranked_tests, start=1):
-        op.metadata["priority_rank"] = rank
 
     return site_demand_map
 
@@ -237,6 +433,7 @@ def compute_priority_ranks_bottleneck_density(
     density_weight=1.0,
     scarcity_weight=0.9,
     precedence_weight=0.6,
+    graph=None,
 ):
     """
     Emphasize bottleneck resources and value density.
@@ -246,67 +443,207 @@ def compute_priority_ranks_bottleneck_density(
     - importance per hour (priority-derived density)
     - scarcity bonus for low-flexibility tests
     - precedence pressure from direct child importance
+
+    graph is an optional prebuilt PrecedenceGraph for the same operation ids.
     """
-    site_demand_map = compute_priority_ranks_site_demand(tests)
-    op_by_id = {op.operation_id: op for op in tests}
-    children_by_op = defaultdict(list)
+    _ensure_priority_attributes(tests)
+    if graph is None:
+        graph = _build_precedence_graph(tests)
+    ops = graph.align(tests)
+    table = _build_test_table(ops, ids_sorted=True)
+    site_demand_map, bottleneck_pressure, _ = _score_site_demand(ops, table)
+
+    n = len(ops)
+    base_importance = table.base_importance
+    density = base_importance / np.maximum(table.durations / 3600.0, 0.25)
+    scarcity_bonus = 1.0 / table.site_options
+
+    # Direct child pressure: max child importance per parent, 0 for leaves.
+    precedence_pressure = np.zeros(n, dtype=np.float64)
+    has_children = graph.child_indptr[1:] > graph.child_indptr[:-1]
+    if has_children.any():
+        precedence_pressure[has_children] = np.maximum.reduceat(
+            base_importance[graph.child_indices], graph.child_indptr[:-1][has_children]
+        )
 
-    for op in tests:
-        for pred_id in op.precedence:
-            if pred_id in op_by_id:
-                children_by_op[pred_id].append(op.operation_id)
+    scores = (
+        bottleneck_weight * bottleneck_pressure
+        + density_weight * density
+        + scarcity_weight * scarcity_bonus
+        + precedence_weight * precedence_pressure
+    )
+
+    score_list = scores.tolist()
+    _write_ranking_fields(
+        ops,
+        {
+            "avg_site_importance": bottleneck_pressure.tolist(),
+            "site_options": table.site_options.tolist(),
+            "priority_score": score_list,
+            "priority_rank": _lexsorted_ranks((-scores,), table).tolist(),
+        },
+        metadata_only={
+            "bottleneck_density_score": score_list,
+            "precedence_pressure": precedence_pressure.tolist(),
+        },
+    )
+
+    return site_demand_map
+
+
+# Site ids are interned to small ints so the site-demand pass works on int32 arrays
+# instead of hashing id strings. The table only grows, so indices stay valid for
+# every operation (and deep copy) that has been cached.
+_SITE_IDS = []
+_SITE_INDEX = {}
+
+
+def _intern_site_ids(site_ids):
+    """Return the interned int32 indices for ``site_ids``, registering new ids."""
+    indices = []
+    for site_id in site_ids:
+        site_idx = _SITE_INDEX.get(site_id)
+        if site_idx is None:
+            site_idx = _SITE_INDEX[site_id] = len(_SITE_IDS)
+            _SITE_IDS.append(site_id)
+        indices.append(site_idx)
+    return np.array(indices, dtype=np.int32)
 
+
+def _cache_priority_attributes(tests):
+    """
+    Store priority-derived values as plain attributes in one pass.
+
+    Sets priority_bucket (int 1-5), base_importance (6 - bucket, floored at 1),
+    clipped_duration_hours (duration in hours, floored at 0.25) and
+    possible_site_idx (the site requirement's candidate ids interned as an int32
+    array, empty if none) so ranking and dispatch code reads attributes instead of
+    repeating metadata lookups and requirement scans.
+    """
     for op in tests:
-        base_priority = float(op.metadata.get("priority", 5))
-        base_importance = max(1.0, 6.0 - base_priority)
-        duration_hours = max(op.duration / 3600.0, 0.25)
-        density = base_importance / duration_hours
-
-        site_options = max(1, int(op.metadata.get("site_options", 1)))
-        scarcity_bonus = 1.0 / site_options
-        bottleneck_pressure = float(op.metadata.get("avg_site_importance", 0.0))
-
-        direct_children = children_by_op.get(op.operation_id, [])
-        if direct_children:
-            child_pressures = [
-                max(1.0, 6.0 - float(op_by_id[child_id].metadata.get("priority", 5)))
-                for child_id in direct_children
-            ]
-            precedence_pressure = max(child_pressures)
-        else:
-            precedence_pressure = 0.0
+        priority_bucket = int(op.metadata.get("priority", 5))
+        op.priority_bucket = priority_bucket
+        op.base_importance = max(1.0, 6.0 - priority_bucket)
+        op.clipped_duration_hours = max(op.duration / 3600.0, 0.25)
+        op.possible_site_idx = _intern_site_ids(op.resource_options.get(SITE, []))
 
-        score = (
-            bottleneck_weight * bottleneck_pressure
-            + density_weight * density
-            + scarcity_weight * scarcity_bonus
-            + precedence_weight * precedence_pressure
-        )
 
-        op.metadata["priority_score"] = score
-        op.metadata["bottleneck_density_score"] = score
-        op.metadata["precedence_pressure"] = precedence_pressure
+def _ensure_priority_attributes(tests):
+    # main() runs the prepass once before copying schedules; direct callers of the
+    # ranking functions get it lazily here.
+    if tests and not hasattr(tests[0], "priority_bucket"):
+        _cache_priority_attributes(tests)
 
-    ranked_tests = sorted(
-        tests,
-        key=lambda op: (
-            -op.metadata.get("bottleneck_density_score", 0.0),
-            op.metadata.get("priority", 5),
-            op.duration,
-            op.operation_id,
-        ),
-    )
+
+def _assign_priority_ranks(ranked_tests):
+    """
+    Write 1-based ranks onto each operation.
+
+    The rank is kept as a plain attribute for the scheduler hot loops and mirrored
+    into metadata for reporting and debugging.
+    """
     for rank, op in enumerate(ranked_tests, start=1):
+        op.priority_rank = rank
         op.metadata["priority_rank"] = rank
 
-    return site_demand_map
+
+class TestTable(NamedTuple):
+    """
+    Column view of the per-test fields the ranking passes read, aligned with a
+    test list and built once per ranking call.
+    """
+
+    priorities: np.ndarray  # bucket priority 1-5 (float64)
+    durations: np.ndarray  # seconds (float64)
+    base_importance: np.ndarray  # 6 - bucket, floored at 1 (float64)
+    site_options: np.ndarray  # candidate site count, floored at 1 (int64)
+    id_rank: np.ndarray  # position in operation_id order, the final tie-break (int64)
+
+
+def _build_test_table(tests, ids_sorted=False):
+    """
+    Gather the ranking columns for tests (which must have cached priority attributes).
+
+    ids_sorted marks tests that are already in operation_id order (e.g. aligned to a
+    PrecedenceGraph), so the id tie-break rank is simply the position.
+    """
+    n = len(tests)
+    priorities = np.fromiter((op.priority_bucket for op in tests), dtype=np.float64, count=n)
+    durations = np.fromiter((op.duration for op in tests), dtype=np.float64, count=n)
+    site_options = np.fromiter((op.possible_site_idx.size for op in tests), dtype=np.int64, count=n)
+    np.maximum(site_options, 1, out=site_options)
+    if ids_sorted:
+        id_rank = np.arange(n, dtype=np.int64)
+    else:
+        id_order = np.argsort(np.array([op.operation_id for op in tests]), kind="stable")
+        id_rank = np.empty(n, dtype=np.int64)
+        id_rank[id_order] = np.arange(n)
+    return TestTable(
+        priorities=priorities,
+        durations=durations,
+        base_importance=np.maximum(1.0, 6.0 - priorities),
+        site_options=site_options,
+        id_rank=id_rank,
+    )
+
+
+def _lexsorted_ranks(leading_keys, table):
+    """
+    1-based ranks ordering tests by leading_keys (ascending, most significant first),
+    breaking ties by bucket priority, duration and finally operation_id.
+
+    leading_keys are arrays aligned with table's tests; negate a score to rank it
+    descending. Returns an int array aligned with the tests.
+    """
+    # np.lexsort treats the last key as the primary one.
+    order = np.lexsort(
+        (table.id_rank, table.durations, table.priorities) + tuple(reversed(leading_keys))
+    )
+    # Invert the permutation: the test at order[k] gets rank k + 1.
+    ranks = np.empty(order.size, dtype=np.int64)
+    ranks[order] = np.arange(1, order.size + 1)
+    return ranks
+
+
+def _write_ranking_fields(tests, fields, metadata_only=None):
+    """
+    Write per-test ranking values in a single pass.
+
+    fields maps an Operation attribute name to values aligned with tests; each value
+    is set as the attribute and mirrored into metadata. metadata_only maps extra
+    metadata keys (reporting only) to aligned values.
+    """
+    names = tuple(fields)
+    columns = list(fields.values())
+    metadata_keys = names
+    if metadata_only:
+        metadata_keys = names + tuple(metadata_only)
+        columns.extend(metadata_only.values())
+    for op, values in zip(tests, zip(*columns)):
+        for name, value in zip(names, values):
+            setattr(op, name, value)
+        op.metadata.update(zip(metadata_keys, values))
 
 
 def _build_children_map(tests):
-    children_by_op = defaultdict(list)
+    """
+    Map predecessor id -> list of child ids (unfiltered precedence edges).
+
+    Two passes: count children per predecessor, then fill preallocated lists, so
+    no list is grown edge by edge.
+    """
+    child_counts = {}
     for op in tests:
         for pred_id in op.precedence:
-            children_by_op[pred_id].append(op.operation_id)
+            child_counts[pred_id] = child_counts.get(pred_id, 0) + 1
+
+    children_by_op = {pred_id: [None] * count for pred_id, count in child_counts.items()}
+    fill_positions = dict.fromkeys(child_counts, 0)
+    for op in tests:
+        for pred_id in op.precedence:
+            position = fill_positions[pred_id]
+            children_by_op[pred_id][position] = op.operation_id
+            fill_positions[pred_id] = position + 1
     return children_by_op
 
 
@@ -330,33 +667,83 @@ def _build_descendant_counts(children_by_op):
 
 
 def _get_priority_weight(op, priority_bucket_weights):
-    priority_bucket = int(op.metadata.get("priority", 5))
+    priority_bucket = getattr(op, "priority_bucket", None)
+    if priority_bucket is None:
+        priority_bucket = int(op.metadata.get("priority", 5))
     return priority_bucket_weights.get(priority_bucket, 1.0)
 
 
-def _get_weighted_test_value_seconds(op, config, duration_seconds_override=None):
+def _get_weighted_test_value_seconds(op, config, duration_seconds_override=None, value_cache=None):
+    """
+    Priority-weighted value of a test, in hour-equivalent seconds.
+
+    value_cache is an optional pow table (see _build_duration_pow_table) mapping
+    duration seconds to hours ** gamma; misses are computed and added. Only share
+    one table between calls that use the same config.
+    """
     duration_seconds = duration_seconds_override if duration_seconds_override is not None else op.duration
-    hours = max(duration_seconds / 3600.0, 0.0)
     priority_weight = _get_priority_weight(op, config["priority_bucket_weights"])
-    value_in_hour_units = priority_weight * (hours ** config["duration_exponent_gamma"])
+    if value_cache is None:
+        duration_term = _duration_pow(duration_seconds, config["duration_exponent_gamma"])
+    else:
+        duration_term = value_cache.get(duration_seconds)
+        if duration_term is None:
+            duration_term = _duration_pow(duration_seconds, config["duration_exponent_gamma"])
+            value_cache[duration_seconds] = duration_term
+    value_in_hour_units = priority_weight * duration_term
     return value_in_hour_units * 3600.0
 
 
-def _evaluate_schedule_metrics(schedule, tests, sites, start_date, end_date, score_config):
+def _duration_pow(duration_seconds, gamma):
+    return max(duration_seconds / 3600.0, 0.0) ** gamma
+
+
+def _build_duration_pow_table(tests, config):
+    """
+    Precompute hours ** gamma for every distinct test duration.
+
+    Durations are rounded to the quarter hour, so a catalog only has a handful of
+    distinct values; the table replaces a pow() per value lookup with a dict hit.
+    """
+    gamma = config["duration_exponent_gamma"]
+    return {duration: _duration_pow(duration, gamma) for duration in {op.duration for op in tests}}
+
+
+def _evaluate_schedule_metrics(
+    schedule, tests, sites, start_date, end_date, score_config, value_cache=None, scheduled_ops=None
+):
+    """
+    Compute coverage/utilization metrics and the weighted strategy score.
+
+    scheduled_ops may be passed when the caller already holds
+    schedule.get_scheduled_operations() for the current state.
+    """
     planning_window_seconds = (end_date - start_date).total_seconds()
     site_capacity_seconds = len(sites) * planning_window_seconds
-    total_demand_seconds = sum(op.duration for op in tests)
+    total_demand_seconds = float(
+        np.fromiter((op.duration for op in tests), dtype=np.float64, count=len(tests)).sum()
+    )
 
-    scheduled_ops = schedule.get_scheduled_operations()
-    scheduled_seconds = sum((op.end_time - op.start_time) for op in scheduled_ops.values())
+    if scheduled_ops is None:
+        scheduled_ops = schedule.get_scheduled_operations()
+    scheduled_seconds = float(
+        np.fromiter(
+            (op.end_time - op.start_time for op in scheduled_ops.values()),
+            dtype=np.float64,
+            count=len(scheduled_ops),
+        ).sum()
+    )
     unscheduled_seconds = total_demand_seconds - scheduled_seconds
 
     total_priority_weighted_value = sum(
-        _get_weighted_test_value_seconds(op, score_config) for op in tests
+        _get_weighted_test_value_seconds(op, score_config, value_cache=value_cache) for op in tests
     )
     scheduled_priority_weighted_value = sum(
         _get_weighted_test_value_seconds(
-            op, score_config, duration_seconds_override=(op.end_time - op.start_time)
+            op,
+            score_config,
+            duration_seconds_override=(op.end_time - op.start_time),
+            value_cache=value_cache,
         )
         for op in scheduled_ops.values()
     )
@@ -378,7 +765,7 @@ def _evaluate_schedule_metrics(schedule, tests, sites, start_date, end_date, sco
     site_utils = [
         resource.get_utilization(start_ts, end_ts)
         for resource in schedule.resources.values()
-        if resource.resource_type == "site"
+        if resource.resource_type == SITE
     ]
     avg_site_utilization = sum(site_utils) / len(site_utils) if site_utils else 0.0
 
@@ -401,94 +788,140 @@ def _evaluate_schedule_metrics(schedule, tests, sites, start_date, end_date, sco
     }
 
 
-def _score_ready_candidate(
-    schedule,
-    operation,
-    start_date,
-    end_date,
-    descendant_counts,
-    mode,
-):
-    earliest = start_date.timestamp()
-    if operation.precedence:
-        earliest = max(earliest, max(schedule.operations[p].end_time for p in operation.precedence))
-    if not operation.can_start_at(earliest, schedule.operations):
-        return None
+def _probe_ready_candidate(schedule, operation, start_ts, end_ts, earliest=None):
+    """
+    Find the earliest feasible placement for a ready operation.
+
+    start_ts/end_ts are the planning horizon as timestamps. earliest may be passed
+    when the caller already tracks the latest predecessor end time (floored at
+    start_ts) and guarantees every predecessor is placed; the precedence check is
+    then skipped. Otherwise it is derived from the predecessors and verified.
+    Returns the placement (without a score) or None if it cannot finish in the horizon.
+    """
+    if earliest is None:
+        earliest = start_ts
+        operations = schedule.operations
+        for pred_id in operation.precedence:
+            pred_end = operations[pred_id].end_time
+            if pred_end > earliest:
+                earliest = pred_end
+        if not operation.can_start_at(earliest, schedule.operations):
+            return None
 
     try:
-        start_ts, assigned = schedule._find_earliest_slot_any_resource(operation, earliest)
+        slot_start_ts, assigned = schedule._find_earliest_slot_any_resource(operation, earliest)
     except RuntimeError:
         return None
 
     effective_duration = schedule.get_effective_duration_for_assignment(
         operation.operation_id, assigned
     )
-    finish_ts = start_ts + effective_duration
-    if finish_ts > end_date.timestamp():
+    finish_ts = slot_start_ts + effective_duration
+    if finish_ts > end_ts:
         return None
-    slack_hours = max(0.0, (end_date.timestamp() - finish_ts) / 3600.0)
+    slack_hours = max(0.0, (end_ts - finish_ts) / 3600.0)
+
+    return {
+        "start_ts": slot_start_ts,
+        "assigned": assigned,
+        "effective_duration": effective_duration,
+        "finish_ts": finish_ts,
+        "slack_hours": slack_hours,
+    }
+
+
+class ReadyColumns(NamedTuple):
+    """
+    Column view of the per-op fields candidate scoring reads, indexed like the
+    PrecedenceGraph and built once per scheduler run.
+    """
+
+    priority_rank: np.ndarray  # 10**9 when unranked (int64)
+    avg_site_importance: np.ndarray  # 0.0 when unset (float64)
+    descendants: np.ndarray  # transitive descendant count (float64)
+    duration: np.ndarray  # nominal duration in seconds (float64)
+
+
+def _build_ready_columns(ops_by_index, descendant_counts):
+    n = len(ops_by_index)
+    return ReadyColumns(
+        priority_rank=np.fromiter(
+            (getattr(op, "priority_rank", 10**9) for op in ops_by_index), dtype=np.int64, count=n
+        ),
+        avg_site_importance=np.fromiter(
+            (float(getattr(op, "avg_site_importance", 0.0)) for op in ops_by_index),
+            dtype=np.float64,
+            count=n,
+        ),
+        descendants=np.fromiter(
+            (descendant_counts.get(op.operation_id, 0) for op in ops_by_index),
+            dtype=np.float64,
+            count=n,
+        ),
+        duration=np.fromiter((op.duration for op in ops_by_index), dtype=np.float64, count=n),
+    )
+
 
+def _score_ready_candidates(op_indices, candidates, columns, max_descendants, mode):
+    """
+    Score probed ready candidates in one vectorized pass.
+
+    op_indices (graph indices into columns) and candidates are aligned lists;
+    returns an array of scores where a higher value is better. Priority mode scores
+    are the negated integer ranks.
+    """
+    ranks = columns.priority_rank[op_indices]
     if mode == "priority":
-        return {
-            "score": -(operation.metadata.get("priority_rank", 10**9)),
-            "start_ts": start_ts,
-            "assigned": assigned,
-            "effective_duration": effective_duration,
-            "finish_ts": finish_ts,
-            "slack_hours": slack_hours,
-        }
-
-    rank = operation.metadata.get("priority_rank", 10**9)
-    priority_term = 1.0 / (1.0 + rank)
+        return -ranks
+
+    slack_hours = np.fromiter((c["slack_hours"] for c in candidates), dtype=np.float64, count=len(candidates))
+    effective_duration = np.fromiter(
+        (c["effective_duration"] for c in candidates), dtype=np.float64, count=len(candidates)
+    )
+    avg_site_importance = columns.avg_site_importance[op_indices]
+    descendants = columns.descendants[op_indices]
+
+    priority_term = 1.0 / (1.0 + ranks)
     slack_urgency_term = 1.0 / (1.0 + slack_hours)
-    throughput_term = 1.0 / max(effective_duration / 3600.0, 0.25)
-    bottleneck_term = float(operation.metadata.get("avg_site_importance", 0.0)) / 6.0
-    max_desc = max(descendant_counts.values()) if descendant_counts else 1
-    unlock_term = descendant_counts.get(operation.operation_id, 0) / max(max_desc, 1)
+    throughput_term = 1.0 / np.maximum(effective_duration / 3600.0, 0.25)
+    bottleneck_term = avg_site_importance / 6.0
+    unlock_term = descendants / max(max_descendants, 1)
 
-    score = (
+    return (
         0.50 * priority_term
         + 0.20 * slack_urgency_term
         + 0.15 * throughput_term
         + 0.10 * bottleneck_term
         + 0.05 * unlock_term
     )
-    return {
-        "score": score,
-        "start_ts": start_ts,
-        "assigned": assigned,
-        "effective_duration": effective_duration,
-        "finish_ts": finish_ts,
-        "slack_hours": slack_hours,
-    }
 
 
 def _site_options_count(operation):
-    for req in operation.get_resource_requirements():
-        if req.get("resource_type") == "site":
-            return len(req.get("possible_resource_ids", [])) or 1
-    return 1
+    possible_site_idx = getattr(operation, "possible_site_idx", None)
+    if possible_site_idx is not None:
+        return possible_site_idx.size or 1
+    return len(operation.resource_options.get(SITE, [])) or 1
 
 
 def _build_decision_candidate_payload(
     operation,
     candidate,
-    end_date,
+    end_ts,
     descendant_counts,
     max_descendants,
 ):
+    slack_hours = candidate.get("slack_hours")
+    if slack_hours is None:
+        slack_hours = max(0.0, (end_ts - candidate["finish_ts"]) / 3600.0)
     return {
         "operation_id": operation.operation_id,
-        "priority_rank": operation.metadata.get("priority_rank", 10**9),
-        "priority": operation.metadata.get("priority", 5),
+        "priority_rank": getattr(operation, "priority_rank", 10**9),
+        "priority": operation.priority_bucket,
         "duration_hours": operation.duration / 3600.0,
         "effective_duration_hours": candidate["effective_duration"] / 3600.0,
-        "slack_hours": candidate.get(
-            "slack_hours",
-            max(0.0, (end_date.timestamp() - candidate["finish_ts"]) / 3600.0),
-        ),
-        "site_options": operation.metadata.get("site_options", _site_options_count(operation)),
-        "avg_site_importance": float(operation.metadata.get("avg_site_importance", 0.0)),
+        "slack_hours": slack_hours,
+        "site_options": getattr(operation, "site_options", None) or _site_options_count(operation),
+        "avg_site_importance": float(getattr(operation, "avg_site_importance", 0.0)),
         "descendant_ratio": descendant_counts.get(operation.operation_id, 0) / max(max_descendants, 1),
         "score": candidate["score"],
         "start_ts": candidate["start_ts"],
@@ -503,15 +936,13 @@ def _build_policy_prefilter_payload(
     descendant_counts,
     max_descendants,
 ):
-    duration_hours = max(operation.duration / 3600.0, 0.25)
-    priority_rank = operation.metadata.get("priority_rank", 10**9)
-    priority_bucket = operation.metadata.get("priority", 5)
+    duration_hours = operation.clipped_duration_hours
+    priority_rank = getattr(operation, "priority_rank", 10**9)
+    priority_bucket = operation.priority_bucket
     priority_proxy = 1.0 / (1.0 + float(priority_rank))
     duration_proxy = 1.0 / duration_hours
-    scarcity_proxy = 1.0 / max(
-        1,
-        int(operation.metadata.get("site_options", _site_options_count(operation))),
-    )
+    site_options = getattr(operation, "site_options", None) or _site_options_count(operation)
+    scarcity_proxy = 1.0 / max(1, int(site_options))
 
     return {
         "operation_id": operation.operation_id,
@@ -521,13 +952,18 @@ def _build_policy_prefilter_payload(
         # Pre-feasibility proxy: no slot search performed yet.
         "effective_duration_hours": duration_hours,
         "slack_hours": max(0.0, planning_horizon_hours - duration_hours),
-        "site_options": operation.metadata.get("site_options", _site_options_count(operation)),
-        "avg_site_importance": float(operation.metadata.get("avg_site_importance", 0.0)),
+        "site_options": site_options,
+        "avg_site_importance": float(getattr(operation, "avg_site_importance", 0.0)),
         "descendant_ratio": descendant_counts.get(operation.operation_id, 0) / max(max_descendants, 1),
         "score": 0.65 * priority_proxy + 0.25 * duration_proxy + 0.10 * scarcity_proxy,
     }
 
 
+# Below this many operations the greedy ready queue is a sorted list maintained with
+# bisect.insort; heapq's per-call overhead only pays off on larger instances.
+_SORTED_READY_MAX_OPS = 128
+
+
 def _run_greedy_schedule(
     schedule,
     start_date,
@@ -540,49 +976,173 @@ def _run_greedy_schedule(
     candidate_policy=None,
     ml_top_k=None,
     ml_fallback_expand=True,
+    graph=None,
 ):
-    start_perf = datetime.now().timestamp()
-    unscheduled = [op for op in schedule.operations.values()]
+    """
+    Greedy list scheduler: repeatedly place the best feasible ready operation.
+
+    graph is an optional prebuilt PrecedenceGraph covering the schedule's
+    operations; it is built on the fly when omitted.
+    """
+    start_perf = time.monotonic()
+    start_ts = start_date.timestamp()
+    end_ts = end_date.timestamp()
+    planning_horizon_hours = max((end_ts - start_ts) / 3600.0, 0.0)
+    operations = schedule.operations
+    unscheduled = dict(operations)
     unscheduled_tests = []
+    _ensure_priority_attributes(list(unscheduled.values()))
+    if graph is None:
+        graph = _build_precedence_graph(unscheduled.values())
+    ops_by_index = graph.align(unscheduled.values())
+    pred_indptr = graph.pred_indptr.tolist()
+    pred_indices = graph.pred_indices.tolist()
+    child_indptr = graph.child_indptr.tolist()
+    child_indices = graph.child_indices.tolist()
+    # Bound once: looked up per probe / placement in the loop below.
+    index_of = graph.index_of
+    place_operation = schedule.schedule_operation_multi_ts
+
+    # Cheap pre-filter order used before expensive feasibility probing. Ranks do not
+    # change during a run, so every key is built once per operation index.
+    if mode == "enhanced_dispatch":
+        ready_keys = [
+            (
+                getattr(op, "priority_rank", 10**9),
+                -getattr(op, "avg_site_importance", 0.0),
+                op.duration,
+                op.operation_id,
+            )
+            for op in ops_by_index
+        ]
+    else:
+        ready_keys = [
+            (getattr(op, "priority_rank", 10**9), op.duration, op.operation_id)
+            for op in ops_by_index
+        ]
+    max_descendants = max(descendant_counts.values()) if descendant_counts else 1
+    ready_columns = _build_ready_columns(ops_by_index, descendant_counts)
+
+    # Track readiness incrementally: an operation enters the ready queue once every
+    # predecessor that was unscheduled at the start has been placed.
+    # pred_max_end holds the running max of placed predecessor end times, so the
+    # earliest start of a ready op is known without rereading its predecessors.
+    # Ops naming a predecessor missing from the schedule still queue as before but
+    # can never be placed, so they are skipped instead of probed.
+    remaining_preds = [0] * len(ops_by_index)
+    pred_max_end = [start_ts] * len(ops_by_index)
+    has_missing_pred = [False] * len(ops_by_index)
+    ready_queue = []
+    for idx, op in enumerate(ops_by_index):
+        has_missing_pred[idx] = len(op.precedence) != pred_indptr[idx + 1] - pred_indptr[idx]
+        pending = 0
+        for pred_idx in pred_indices[pred_indptr[idx]:pred_indptr[idx + 1]]:
+            pred = ops_by_index[pred_idx]
+            if not pred.is_scheduled():
+                pending += 1
+            elif pred.end_time > pred_max_end[idx]:
+                pred_max_end[idx] = pred.end_time
+        remaining_preds[idx] = pending
+        if pending == 0:
+            ready_queue.append((ready_keys[idx], op))
+
+    # Ready keys are unique, so both queue flavours pop entries in the same order.
+    # restore_ready puts back the unselected part of a popped batch; those entries
+    # are sorted and no larger than anything left in the queue.
+    if len(ops_by_index) < _SORTED_READY_MAX_OPS:
+        ready_queue.sort()
+
+        def push_ready(entry):
+            bisect.insort(ready_queue, entry)
+
+        def pop_ready(count):
+            entries = ready_queue[:count]
+            del ready_queue[:count]
+            return entries
+
+        def restore_ready(entries):
+            ready_queue[:0] = entries
+    else:
+        heapq.heapify(ready_queue)
+
+        def push_ready(entry):
+            heapq.heappush(ready_queue, entry)
+
+        def pop_ready(count):
+            if count >= len(ready_queue):
+                entries = sorted(ready_queue)
+                ready_queue.clear()
+                return entries
+            return [heapq.heappop(ready_queue) for _ in range(count)]
+
+        def restore_ready(entries):
+            if not ready_queue:
+                # A sorted list is already a valid heap.
+                ready_queue.extend(entries)
+            else:
+                for entry in entries:
+                    heapq.heappush(ready_queue, entry)
+
+    def evaluate_ops(ops, candidate_rows, best, selected):
+        """
+        Probe and score ops, appending decision rows; returns the updated
+        (best placement, selected op), replacing them only on a strictly higher score.
+        """
+        probed_ops = []
+        probed_idx = []
+        probed = []
+        for op in ops:
+            op_idx = index_of[op.operation_id]
+            if has_missing_pred[op_idx]:
+                continue
+            candidate = _probe_ready_candidate(
+                schedule,
+                op,
+                start_ts,
+                end_ts,
+                earliest=pred_max_end[op_idx],
+            )
+            if candidate is not None:
+                probed_ops.append(op)
+                probed_idx.append(op_idx)
+                probed.append(candidate)
+        if not probed:
+            return best, selected
+
+        scores = _score_ready_candidates(probed_idx, probed, ready_columns, max_descendants, mode)
+        for op, candidate, score in zip(probed_ops, probed, scores.tolist()):
+            candidate["score"] = score
+            payload = _build_decision_candidate_payload(
+                op, candidate, end_ts, descendant_counts, max_descendants
+            )
+            candidate_rows.append((op, candidate, payload))
+
+        winner = int(np.argmax(scores))
+        if best is None or probed[winner]["score"] > best["score"]:
+            return probed[winner], probed_ops[winner]
+        return best, selected
 
+    # Each pass either places (or drops) one op or ends the run: there is no
+    # progress flag and no rescan of the ready set. Ops only become ready when a
+    # placement releases their last predecessor, so a batch with no feasible op
+    # cannot become feasible later and the loop stops there.
     while unscheduled:
         if max_runtime_seconds is not None:
-            if datetime.now().timestamp() - start_perf > max_runtime_seconds:
-                unscheduled_tests.extend(unscheduled)
+            if time.monotonic() - start_perf > max_runtime_seconds:
                 break
-        ready = [
-            op for op in unscheduled
-            if all(schedule.operations[p].is_scheduled() for p in op.precedence)
-        ]
-        if not ready:
+        if not ready_queue:
             break
 
-        if max_ready_eval is not None and len(ready) > max_ready_eval:
-            # Cheap pre-filter before expensive feasibility probing.
-            if mode == "enhanced_dispatch":
-                ready = sorted(
-                    ready,
-                    key=lambda op: (
-                        op.metadata.get("priority_rank", 10**9),
-                        -op.metadata.get("avg_site_importance", 0.0),
-                        op.duration,
-                        op.operation_id,
-                    ),
-                )[:max_ready_eval]
-            else:
-                ready = sorted(
-                    ready,
-                    key=lambda op: (
-                        op.metadata.get("priority_rank", 10**9),
-                        op.duration,
-                        op.operation_id,
-                    ),
-                )[:max_ready_eval]
+        # Pop the best max_ready_eval entries; the ones not selected are pushed back.
+        batch_size = len(ready_queue)
+        if max_ready_eval is not None:
+            batch_size = min(batch_size, max_ready_eval)
+        ready_entries = pop_ready(batch_size)
+        ready = [op for _, op in ready_entries]
 
         best = None
         selected = None
         candidate_rows = []
-        max_descendants = max(descendant_counts.values()) if descendant_counts else 1
 
         ready_for_feasibility = ready
         topk_applied = False
@@ -594,54 +1154,43 @@ def _run_greedy_schedule(
             and int(ml_top_k) > 0
             and len(ready) > int(ml_top_k)
         ):
-            planning_horizon_hours = max(
-                (end_date.timestamp() - start_date.timestamp()) / 3600.0,
-                0.0,
+            prefilter_scores = np.fromiter(
+                (
+                    candidate_policy.score_candidate(
+                        _build_policy_prefilter_payload(
+                            op,
+                            planning_horizon_hours=planning_horizon_hours,
+                            descendant_counts=descendant_counts,
+                            max_descendants=max_descendants,
+                        )
+                    )
+                    for op in ready
+                ),
+                dtype=np.float64,
+                count=len(ready),
             )
-            ranked_ready = []
-            for op in ready:
-                payload = _build_policy_prefilter_payload(
-                    op,
-                    planning_horizon_hours=planning_horizon_hours,
-                    descendant_counts=descendant_counts,
-                    max_descendants=max_descendants,
-                )
-                policy_prefilter_score = float(candidate_policy.score_candidate(payload))
-                ranked_ready.append((op, policy_prefilter_score))
-
-            ranked_ready.sort(
-                key=lambda row: (
-                    -row[1],
-                    row[0].metadata.get("priority_rank", 10**9),
-                    row[0].duration,
-                    row[0].operation_id,
+            # Best policy score first, then rank, duration and operation id. Graph
+            # indices follow sorted operation ids, so they serve as the final key.
+            ready_idx = np.fromiter(
+                (index_of[op.operation_id] for op in ready), dtype=np.int64, count=len(ready)
+            )
+            order = np.lexsort(
+                (
+                    ready_idx,
+                    ready_columns.duration[ready_idx],
+                    ready_columns.priority_rank[ready_idx],
+                    -prefilter_scores,
                 )
             )
-            ready_for_feasibility = [op for op, _ in ranked_ready[: int(ml_top_k)]]
+            ready_for_feasibility = [ready[i] for i in order[: int(ml_top_k)].tolist()]
             topk_applied = True
 
-        def _evaluate_ops(ops):
-            nonlocal best, selected
-            for op in ops:
-                candidate = _score_ready_candidate(
-                    schedule, op, start_date, end_date, descendant_counts, mode
-                )
-                if candidate is None:
-                    continue
-                payload = _build_decision_candidate_payload(
-                    op, candidate, end_date, descendant_counts, max_descendants
-                )
-                candidate_rows.append((op, candidate, payload))
-                if best is None or candidate["score"] > best["score"]:
-                    best = candidate
-                    selected = op
-
-        _evaluate_ops(ready_for_feasibility)
+        best, selected = evaluate_ops(ready_for_feasibility, candidate_rows, best, selected)
         if selected is None and topk_applied and ml_fallback_expand:
             shortlisted_ids = {op.operation_id for op in ready_for_feasibility}
             remaining = [op for op in ready if op.operation_id not in shortlisted_ids]
             if remaining:
-                _evaluate_ops(remaining)
+                best, selected = evaluate_ops(remaining, candidate_rows, best, selected)
                 fallback_used = True
 
         selection_mode = "heuristic"
@@ -676,20 +1225,254 @@ def _run_greedy_schedule(
         if selected is None:
             break
 
-        if schedule.schedule_operation_multi(
-            selected.operation_id, best["assigned"], datetime.fromtimestamp(best["start_ts"])
-        ):
-            unscheduled.remove(selected)
+        restore_ready([entry for entry in ready_entries if entry[1] is not selected])
+
+        if place_operation(selected.operation_id, best["assigned"], best["start_ts"]):
+            del unscheduled[selected.operation_id]
+            selected_idx = index_of[selected.operation_id]
+            selected_end = selected.end_time
+            for child_idx in child_indices[child_indptr[selected_idx]:child_indptr[selected_idx + 1]]:
+                if selected_end > pred_max_end[child_idx]:
+                    pred_max_end[child_idx] = selected_end
+                remaining_preds[child_idx] -= 1
+                if remaining_preds[child_idx] == 0:
+                    child = ops_by_index[child_idx]
+                    push_ready((ready_keys[child_idx], child))
         else:
-            unscheduled.remove(selected)
+            del unscheduled[selected.operation_id]
             unscheduled_tests.append(selected)
 
-    for op in list(unscheduled):
-        unscheduled_tests.append(op)
-        unscheduled.remove(op)
+    unscheduled_tests.extend(unscheduled.values())
+    unscheduled.clear()
     return unscheduled_tests
 
 
+# CP-SAT objectives are integral; score contributions are fractions of 1.
+_CP_SAT_OBJECTIVE_SCALE = 10**7
+
+
+def _cp_sat_shift_windows(schedule, horizon_start, horizon_seconds):
+    """
+    Allowed start windows for the CP-SAT model, as (offset_start, offset_end, strict).
+
+    Taken from the first ShiftConstraint that is not in "ignore" mode and expanded
+    to concrete windows over the horizon (offsets in seconds from horizon_start).
+    Returns (None, None) when no shift constraint applies.
+    """
+    for constraint in schedule.constraints:
+        if isinstance(constraint, ShiftConstraint) and constraint.mode != "ignore":
+            break
+    else:
+        return None, None
+
+    windows = set()
+    day = horizon_start.date() - timedelta(days=1)
+    last_day = (horizon_start + timedelta(seconds=horizon_seconds)).date()
+    while day <= last_day:
+        for shift_start, shift_end in constraint.shift_windows:
+            window_start = datetime.combine(day, shift_start)
+            window_end = datetime.combine(day, shift_end)
+            if window_end <= window_start:
+                window_end += timedelta(days=1)
+            lo = max(int((window_start - horizon_start).total_seconds()), 0)
+            hi = min(int((window_end - horizon_start).total_seconds()), horizon_seconds)
+            if lo < hi:
+                windows.add((lo, hi))
+        day += timedelta(days=1)
+    return sorted(windows), constraint
+
+
+def _cp_sat_changeover_padding(schedule):
+    """
+    Largest changeover gap per resource type, used to pad no-overlap intervals.
+
+    Padding every interval is conservative (it also separates ops that would not
+    need a changeover) but keeps the solution feasible for the changeover checks.
+    """
+    padding = defaultdict(int)
+    resource_types = {resource.resource_type for resource in schedule.resources.values()}
+    for constraint in schedule.constraints:
+        if not isinstance(constraint, ChangeoverConstraint):
+            continue
+        gap = int(constraint.changeover_seconds)
+        for resource_type in constraint.resource_type_filter or resource_types:
+            padding[resource_type] = max(padding[resource_type], gap)
+    return padding
+
+
+def _run_cp_sat_schedule(
+    schedule,
+    start_date,
+    end_date,
+    score_config,
+    value_cache=None,
+    max_runtime_seconds=None,
+    num_workers=8,
+    hint_placements=None,
+):
+    """
+    Schedule all unplaced operations with one OR-Tools CP-SAT model.
+
+    Each operation picks at most one (assignment, shift window) option; options are
+    optional intervals on every resource they use, with AddNoOverlap per resource.
+    Precedence and shift windows are modelled exactly, changeovers by padding and
+    soak lags are left to the final placement pass. The objective is the weighted
+    strategy score of _evaluate_schedule_metrics (priority coverage plus site
+    capacity used), scaled to integers. The solution is written back
+    through schedule_operation_multi_ts in start order, so every placement still
+    goes through the schedule's own checks; anything rejected there is returned
+    as unscheduled like the greedy scheduler does.
+
+    hint_placements optionally maps operation_id -> (start_ts, assigned_resources),
+    e.g. a greedy run's result, and is passed to the solver as a warm start.
+    """
+    if not ORTOOLS_AVAILABLE:
+        raise ImportError("ortools is required for the cp_sat scheduler mode")
+
+    horizon_start_ts = start_date.timestamp()
+    horizon = int(end_date.timestamp() - horizon_start_ts)
+    operations = schedule.operations
+    resources = schedule.resources
+    windows, shift_constraint = _cp_sat_shift_windows(schedule, start_date, horizon)
+    padding = _cp_sat_changeover_padding(schedule)
+    # "allow_overrun" shifts only bound the start; "strict" ones the whole run.
+    strict_shift = shift_constraint is None or shift_constraint.mode == "strict"
+
+    hint_placements = hint_placements or {}
+
+    model = cp_model.CpModel()
+    intervals_by_resource = defaultdict(list)
+    start_var = {}
+    end_var = {}
+    present = {}
+    options_by_op = {}
+    objective_terms = []
+    # Per-second weights of the two score terms, so an option's coefficient is
+    # coverage_weight * value(effective duration) + utilization_weight * seconds.
+    total_value = sum(
+        _get_weighted_test_value_seconds(op, score_config, value_cache=value_cache)
+        for op in operations.values()
+    )
+    site_capacity = horizon * sum(1 for resource in resources.values() if resource.resource_type == SITE)
+    coverage_weight = score_config["priority_coverage_weight"] / total_value if total_value > 0 else 0.0
+    utilization_weight = score_config["site_utilization_weight"] / site_capacity if site_capacity > 0 else 0.0
+
+    for op_id, op in operations.items():
+        if not op.is_scheduled():
+            continue
+        offset = int(op.start_time - horizon_start_ts)
+        length = int(math.ceil(op.end_time - op.start_time))
+        for resource_id in op.get_assigned_resource_ids():
+            pad = padding[resources[resource_id].resource_type]
+            intervals_by_resource[resource_id].append(
+                model.NewFixedSizeIntervalVar(offset, length + pad, f"fixed_{op_id}_{resource_id}")
+            )
+
+    for op_id, op in operations.items():
+        if op.is_scheduled():
+            continue
+        requirements = op.get_resource_requirements()
+        if not requirements or any(pred_id not in operations for pred_id in op.precedence):
+            continue
+        resource_types = {req["resource_type"] for req in requirements}
+        shift_applies = windows is not None and (
+            not shift_constraint.resource_type_filter
+            or not resource_types.isdisjoint(shift_constraint.resource_type_filter)
+        )
+
+        start = model.NewIntVar(0, horizon, f"start_{op_id}")
+        end = model.NewIntVar(0, horizon, f"end_{op_id}")
+        hint = hint_placements.get(op_id)
+        hint_offset = None
+        if hint is not None:
+            hint_offset = int(hint[0] - horizon_start_ts)
+            model.AddHint(start, hint_offset)
+        literals = []
+        options = []
+        for assignment in itertools.product(*(req["possible_resource_ids"] for req in requirements)):
+            if any(resource_id not in resources for resource_id in assignment):
+                continue
+            assigned = schedule._build_assigned_resources(requirements, list(assignment))
+            duration = int(math.ceil(schedule.get_effective_duration_for_assignment(op_id, assigned)))
+            if duration > horizon:
+                continue
+            for lo, hi in windows if shift_applies else [(0, horizon)]:
+                latest_start = min(hi - duration if strict_shift else hi - 1, horizon - duration)
+                if latest_start < lo:
+                    continue
+                literal = model.NewBoolVar(f"use_{op_id}_{len(literals)}")
+                model.AddHint(
+                    literal,
+                    hint is not None and hint[1] == assigned and lo <= hint_offset <= latest_start,
+                )
+                model.Add(start >= lo).OnlyEnforceIf(literal)
+                model.Add(start <= latest_start).OnlyEnforceIf(literal)
+                model.Add(end == start + duration).OnlyEnforceIf(literal)
+                for resource_id in assignment:
+                    pad = padding[resources[resource_id].resource_type]
+                    intervals_by_resource[resource_id].append(
+                        model.NewOptionalFixedSizeIntervalVar(
+                            start, duration + pad, literal, f"iv_{op_id}_{resource_id}_{len(literals)}"
+                        )
+                    )
+                value = _get_weighted_test_value_seconds(
+                    op, score_config, duration_seconds_override=duration, value_cache=value_cache
+                )
+                coefficient = coverage_weight * value + utilization_weight * duration
+                objective_terms.append((int(round(coefficient * _CP_SAT_OBJECTIVE_SCALE)), literal))
+                literals.append(literal)
+                options.append((literal, assigned))
+        if not literals:
+            continue
+
+        is_present = model.NewBoolVar(f"present_{op_id}")
+        model.Add(sum(literals) == is_present)
+        start_var[op_id] = start
+        end_var[op_id] = end
+        present[op_id] = is_present
+        options_by_op[op_id] = options
+
+    for op_id, is_present in present.items():
+        for pred_id in operations[op_id].precedence:
+            pred = operations[pred_id]
+            if pred.is_scheduled():
+                model.Add(start_var[op_id] >= int(math.ceil(pred.end_time - horizon_start_ts))).OnlyEnforceIf(
+                    is_present
+                )
+            elif pred_id in present:
+                model.AddImplication(is_present, present[pred_id])
+                model.Add(start_var[op_id] >= end_var[pred_id]).OnlyEnforceIf(is_present)
+            else:
+                model.Add(is_present == 0)
+
+    for intervals in intervals_by_resource.values():
+        if len(intervals) > 1:
+            model.AddNoOverlap(intervals)
+
+    model.Maximize(sum(coefficient * literal for coefficient, literal in objective_terms))
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = num_workers
+    # Changeover padding is stricter than the real check, so a greedy hint can be
+    # slightly infeasible; let the solver repair it instead of discarding it.
+    solver.parameters.repair_hint = True
+    if max_runtime_seconds is not None:
+        solver.parameters.max_time_in_seconds = float(max_runtime_seconds)
+    status = solver.Solve(model)
+
+    placements = []
+    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        for op_id, options in options_by_op.items():
+            if not solver.BooleanValue(present[op_id]):
+                continue
+            assigned = next(assigned for literal, assigned in options if solver.BooleanValue(literal))
+            placements.append((solver.Value(start_var[op_id]), op_id, assigned))
+
+    for offset, op_id, assigned in sorted(placements, key=itemgetter(0, 1)):
+        schedule.schedule_operation_multi_ts(op_id, assigned, horizon_start_ts + offset)
+    return [op for op_id, op in operations.items() if not op.is_scheduled()]
+
+
 def _load_candidate_policy_from_env():
     use_ml = os.getenv("SCHED_USE_ML_POLICY", "").strip().lower() in {"1", "true", "yes"}
     if not use_ml:
@@ -712,28 +1495,43 @@ def _run_repair_pass(
     max_assignments_per_candidate=24,
     max_starts_per_assignment=40,
     max_runtime_seconds=None,
+    value_cache=None,
 ):
     """
     Lightweight repair pass: place high-value unscheduled operations by evicting
     at most one lower-value conflicting leaf operation.
+
+    value_cache is an optional duration pow table shared with
+    _get_weighted_test_value_seconds (same score_config only).
     """
-    unscheduled_set = {op.operation_id for op in unscheduled_tests}
+    # Insertion-ordered id -> op map: O(1) membership and removal while keeping the
+    # returned list in the same order as the old filtered list.
+    unscheduled_by_id = {op.operation_id: op for op in unscheduled_tests}
     made_change = False
-    repair_start_perf = datetime.now().timestamp()
-
-    ranked_unscheduled = sorted(
-        unscheduled_tests,
-        key=lambda op: _get_weighted_test_value_seconds(op, score_config),
-        reverse=True,
-    )
+    repair_start_perf = time.monotonic()
+    horizon_start_ts = schedule.start_date.timestamp()
+    horizon_end_ts = schedule.end_date.timestamp()
+    # Bound once: used inside the assignment x start-time loops.
+    operations = schedule.operations
+    resources = schedule.resources
+    constraints_allow = schedule._constraints_allow
+    # Ids currently on the schedule, kept in step with every place / evict below
+    # so the precedence gate is one subset test instead of a method call per pred.
+    scheduled_ids = {op_id for op_id, op in operations.items() if op.is_scheduled()}
+
+    candidate_values = [
+        _get_weighted_test_value_seconds(op, score_config, value_cache=value_cache)
+        for op in unscheduled_tests
+    ]
+    ranked_unscheduled = [
+        unscheduled_tests[idx]
+        for idx in sorted(range(len(unscheduled_tests)), key=candidate_values.__getitem__, reverse=True)
+    ]
     for candidate in ranked_unscheduled[:max_candidates]:
         if max_runtime_seconds is not None:
-            if datetime.now().timestamp() - repair_start_perf > max_runtime_seconds:
+            if time.monotonic() - repair_start_perf > max_runtime_seconds:
                 break
-        if any(
-            (pred_id in unscheduled_set) or (not schedule.operations[pred_id].is_scheduled())
-            for pred_id in candidate.precedence
-        ):
+        if not scheduled_ids.issuperset(candidate.precedence):
             continue
 
         requirements = candidate.get_resource_requirements()
@@ -741,15 +1539,15 @@ def _run_repair_pass(
             continue
         resource_candidates = [req["possible_resource_ids"] for req in requirements]
 
-        earliest = schedule.start_date.timestamp()
-        if candidate.precedence:
-            earliest = max(
-                earliest, max(schedule.operations[p].end_time for p in candidate.precedence)
-            )
+        earliest = horizon_start_ts
+        for pred_id in candidate.precedence:
+            pred_end = operations[pred_id].end_time
+            if pred_end > earliest:
+                earliest = pred_end
 
         for assignment_idx, assignment in enumerate(itertools.product(*resource_candidates)):
             if max_runtime_seconds is not None:
-                if datetime.now().timestamp() - repair_start_perf > max_runtime_seconds:
+                if time.monotonic() - repair_start_perf > max_runtime_seconds:
                     break
             if assignment_idx >= max_assignments_per_candidate:
                 break
@@ -760,7 +1558,7 @@ def _run_repair_pass(
 
             candidate_starts = {earliest}
             for resource_id in assignment:
-                for op in schedule.resources[resource_id].schedule:
+                for op in resources[resource_id].schedule:
                     if op.end_time >= earliest:
                         candidate_starts.add(op.end_time)
 
@@ -768,13 +1566,13 @@ def _run_repair_pass(
                 if start_idx >= max_starts_per_assignment:
                     break
                 end_ts = start_ts + duration
-                if end_ts > schedule.end_date.timestamp():
+                if end_ts > horizon_end_ts:
                     continue
 
                 conflicting_ops = set()
                 feasible = True
                 for req, resource_id in zip(requirements, assignment):
-                    resource = schedule.resources.get(resource_id)
+                    resource = resources.get(resource_id)
                     if not resource:
                         feasible = False
                         break
@@ -782,7 +1580,7 @@ def _run_repair_pass(
                         if op.end_time <= start_ts or op.start_time >= end_ts:
                             continue
                         conflicting_ops.add(op)
-                    if not schedule._constraints_allow(candidate, resource, start_ts, end_ts):
+                    if not constraints_allow(candidate, resource, start_ts, end_ts):
                         feasible = False
                         break
                 if not feasible:
@@ -795,51 +1593,254 @@ def _run_repair_pass(
                 if evicted_op is not None:
                     if children_by_op.get(evicted_op.operation_id):
                         continue
-                    candidate_value = _get_weighted_test_value_seconds(candidate, score_config)
-                    evicted_value = _get_weighted_test_value_seconds(evicted_op, score_config)
+                    candidate_value = _get_weighted_test_value_seconds(
+                        candidate, score_config, value_cache=value_cache
+                    )
+                    evicted_value = _get_weighted_test_value_seconds(
+                        evicted_op, score_config, value_cache=value_cache
+                    )
                     if candidate_value <= evicted_value:
                         continue
                     evicted_start_ts = evicted_op.start_time
                     evicted_assigned = dict(evicted_op.assigned_resources)
                     schedule.unschedule_operation(evicted_op.operation_id)
-                    unscheduled_set.add(evicted_op.operation_id)
-                    unscheduled_tests.append(evicted_op)
+                    scheduled_ids.discard(evicted_op.operation_id)
+                    unscheduled_by_id[evicted_op.operation_id] = evicted_op
 
-                if not candidate.can_start_at(start_ts, schedule.operations):
+                # Predecessors are all placed (gate above) and have children, so they
+                # are never evicted; the max of their end times computed once per
+                # candidate stands in for can_start_at.
+                if start_ts < earliest:
                     continue
 
-                placed = schedule.schedule_operation_multi(
+                placed = schedule.schedule_operation_multi_ts(
                     candidate.operation_id,
                     assigned_resources,
-                    datetime.fromtimestamp(start_ts),
+                    start_ts,
                 )
                 if not placed:
                     if evicted_op is not None:
-                        schedule.schedule_operation_multi(
+                        schedule.schedule_operation_multi_ts(
                             evicted_op.operation_id,
                             evicted_assigned,
-                            datetime.fromtimestamp(evicted_start_ts),
+                            evicted_start_ts,
                         )
-                        unscheduled_set.discard(evicted_op.operation_id)
-                        unscheduled_tests = [
-                            op for op in unscheduled_tests if op.operation_id != evicted_op.operation_id
-                        ]
+                        scheduled_ids.add(evicted_op.operation_id)
+                        unscheduled_by_id.pop(evicted_op.operation_id, None)
                     continue
 
-                unscheduled_set.discard(candidate.operation_id)
-                unscheduled_tests = [
-                    op for op in unscheduled_tests if op.operation_id != candidate.operation_id
-                ]
+                scheduled_ids.add(candidate.operation_id)
+                unscheduled_by_id.pop(candidate.operation_id, None)
                 made_change = True
                 break
 
-            if candidate.operation_id not in unscheduled_set:
+            if candidate.operation_id not in unscheduled_by_id:
                 break
 
-    return unscheduled_tests, made_change
+    return list(unscheduled_by_id.values()), made_change
+
+
+# Shared read-only inputs for comparison runs. Set by _run_comparisons_in_workers
+# right before forking so worker processes inherit it without pickling.
+_COMPARISON_CONTEXT = None
+
+
+def _run_comparison(context, strategy_name, scheduler_name):
+    """
+    Rank a fresh copy of the base schedule with one strategy, schedule it with one
+    scheduler mode, and score the result.
+
+    Returns (comparison row, scheduled copy).
+    """
+    score_config = context["score_config"]
+    performance_config = context["performance_config"]
+    scheduler_cfg = context["scheduler_modes"][scheduler_name]
+    if scheduler_cfg["base_mode"] not in {"priority", "enhanced_dispatch", "cp_sat"}:
+        raise ValueError(f"Unknown scheduler mode: {scheduler_cfg['base_mode']}")
+
+    run_schedule = deepcopy(context["schedule"])
+    site_demand_map = context["ranking_strategies"][strategy_name](list(run_schedule.operations.values()))
+
+    if scheduler_cfg["base_mode"] == "cp_sat":
+        # Warm-start the solver from a greedy run of the same ranking.
+        hint_schedule = deepcopy(run_schedule)
+        _run_greedy_schedule(
+            hint_schedule,
+            context["start_date"],
+            context["end_date"],
+            context["descendant_counts"],
+            max_ready_eval=performance_config["max_ready_eval"],
+            max_runtime_seconds=performance_config["max_greedy_runtime_seconds"],
+            graph=context["precedence_graph"],
+        )
+        unscheduled_tests = _run_cp_sat_schedule(
+            run_schedule,
+            context["start_date"],
+            context["end_date"],
+            score_config,
+            value_cache=context["weighted_value_cache"],
+            max_runtime_seconds=performance_config["max_cp_sat_runtime_seconds"],
+            num_workers=performance_config["cp_sat_workers"],
+            hint_placements={
+                op_id: (op.start_time, op.assigned_resources)
+                for op_id, op in hint_schedule.get_scheduled_operations().items()
+            },
+        )
+    else:
+        unscheduled_tests = _run_greedy_schedule(
+            run_schedule,
+            context["start_date"],
+            context["end_date"],
+            context["descendant_counts"],
+            mode=scheduler_cfg["base_mode"],
+            max_ready_eval=performance_config["max_ready_eval"],
+            max_runtime_seconds=performance_config["max_greedy_runtime_seconds"],
+            candidate_policy=context["candidate_policy"],
+            ml_top_k=context["ml_top_k"],
+            ml_fallback_expand=context["ml_fallback_expand"],
+            graph=context["precedence_graph"],
+        )
+
+    if scheduler_cfg["repair"]:
+        unscheduled_tests, _ = _run_repair_pass(
+            run_schedule,
+            unscheduled_tests,
+            score_config,
+            context["children_by_op"],
+            max_candidates=performance_config["max_repair_candidates"],
+            max_assignments_per_candidate=performance_config["max_repair_assignments_per_candidate"],
+            max_starts_per_assignment=performance_config["max_repair_starts_per_assignment"],
+            max_runtime_seconds=performance_config["max_repair_runtime_seconds"],
+            value_cache=context["weighted_value_cache"],
+        )
 
+    stats = run_schedule.get_schedule_statistics()
+    scheduled_ops = run_schedule.get_scheduled_operations()
+    run_metrics = _evaluate_schedule_metrics(
+        run_schedule,
+        list(run_schedule.operations.values()),
+        context["sites"],
+        context["start_date"],
+        context["end_date"],
+        score_config,
+        value_cache=context["weighted_value_cache"],
+        scheduled_ops=scheduled_ops,
+    )
+    result = {
+        "ranking_strategy": strategy_name,
+        "scheduler": scheduler_name,
+        "scheduled_operations": len(scheduled_ops),
+        "unscheduled_operations": len(unscheduled_tests),
+        "scheduled_seconds": run_metrics["scheduled_seconds"],
+        "unscheduled_seconds": run_metrics["unscheduled_seconds"],
+        "demand_coverage_percent": run_metrics["demand_coverage_percent"],
+        "priority_weighted_coverage_percent": run_metrics["priority_weighted_coverage_percent"],
+        "site_capacity_used_percent": run_metrics["site_capacity_used_percent"],
+        "strategy_score": run_metrics["strategy_score"],
+        "makespan_hours": stats["makespan_hours"],
+        "avg_site_utilization": run_metrics["avg_site_utilization"],
+        "site_demand_map": site_demand_map,
+    }
+    return result, run_schedule
 
-def main():
+
+def _get_comparison_worker_count(task_count):
+    """
+    Worker processes for the strategy comparison (SCHED_COMPARISON_WORKERS, default 1).
+
+    Parallel runs rely on fork so workers inherit the schedule, whose duration policy
+    wraps a local function and cannot be pickled; without fork it stays serial.
+    """
+    raw = os.getenv("SCHED_COMPARISON_WORKERS", "").strip()
+    workers = int(raw) if raw else 1
+    if workers <= 1 or task_count <= 1:
+        return 1
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    return min(workers, task_count)
+
+
+def _run_comparison_in_worker(task):
+    strategy_name, scheduler_name = task
+    result, run_schedule = _run_comparison(_COMPARISON_CONTEXT, strategy_name, scheduler_name)
+    placements = [
+        (op.operation_id, op.start_time, op.end_time, op.resource_id, dict(op.assigned_resources))
+        for op in run_schedule.operations.values()
+        if op.is_scheduled()
+    ]
+    return result, placements
+
+
+def _run_comparisons_in_workers(context, tasks, workers):
+    """
+    Run comparison tasks in forked worker processes.
+
+    Yields (comparison row, placements) in task order.
+    """
+    global _COMPARISON_CONTEXT
+    _COMPARISON_CONTEXT = context
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            yield from executor.map(_run_comparison_in_worker, tasks)
+    finally:
+        _COMPARISON_CONTEXT = None
+
+
+def _restore_comparison_schedule(context, strategy_name, placements):
+    """
+    Rebuild a worker's schedule in this process from its placements.
+
+    Ranks a fresh copy with the same strategy (so rank attributes match) and writes
+    the recorded assignments back without re-running the scheduler.
+    """
+    restored = deepcopy(context["schedule"])
+    context["ranking_strategies"][strategy_name](list(restored.operations.values()))
+    for operation_id, start_ts, end_ts, resource_id, assigned_resources in sorted(
+        placements, key=itemgetter(1)
+    ):
+        op = restored.operations[operation_id]
+        op.start_time = start_ts
+        op.end_time = end_ts
+        op.resource_id = resource_id
+        op.assigned_resources = assigned_resources
+        for assigned_id in op.get_assigned_resource_ids():
+            restored.resources[assigned_id].add_operation(op)
+    return restored
+
+
+def _render_gantt_chart(schedule, resource_type, title_suffix):
+    schedule.show_visual_gantt_chart(
+        resource_type_filter=[resource_type], title_suffix=title_suffix, block=True
+    )
+
+
+def _show_gantt_charts(schedule):
+    """
+    Open the site and vehicle Gantt charts, each rendered in its own process.
+
+    Uses fork so the children inherit the schedule (see _get_comparison_worker_count);
+    matplotlib is imported lazily, so the parent never initialises a GUI backend
+    before forking. Without fork the charts are shown one after the other.
+    """
+    charts = ((SITE, "Sites"), (VEHICLE, "Vehicles"))
+    if "fork" not in multiprocessing.get_all_start_methods():
+        for resource_type, title_suffix in charts:
+            _render_gantt_chart(schedule, resource_type, title_suffix)
+        return
+    fork_context = multiprocessing.get_context("fork")
+    processes = [
+        fork_context.Process(target=_render_gantt_chart, args=(schedule, resource_type, title_suffix))
+        for resource_type, title_suffix in charts
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def main(show_charts: Optional[bool] = None):
     schedule, tests, sites, vehicles, start_date, end_date = build_vehicle_testing_problem()
     candidate_policy = _load_candidate_policy_from_env()
     ml_top_k_raw = os.getenv("SCHED_ML_TOP_K", "").strip()
@@ -853,11 +1854,19 @@ def main():
             fallback_label = "enabled" if ml_fallback_expand else "disabled"
             print(f"ML top-K gating enabled (K={ml_top_k}, fallback_expand={fallback_label}).")
 
+    # Precedence adjacency and priority-derived attributes never change across
+    # strategies or deep copies, so compute them once up front. Precedence lists are
+    # frozen to tuples here too; nothing mutates them after the problem is built.
+    for op in tests:
+        op.precedence = tuple(op.precedence)
+    precedence_graph = _build_precedence_graph(tests)
+    _cache_priority_attributes(tests)
+
     ranking_strategies = {
         "naive": lambda ops: (compute_priority_ranks_naive(ops) or {}),
         # "site_demand": lambda ops: compute_priority_ranks_site_demand(ops),
         # "site_demand_with_precedence": lambda ops: compute_priority_ranks_site_demand_with_precedence(
-        #     ops, propagation_weight=0.85
+        #     ops, propagation_weight=0.85, graph=precedence_graph
         # ),
         # "importance_throughput": lambda ops: compute_priority_ranks_importance_throughput(
         #     ops,
@@ -865,6 +1874,7 @@ def main():
         #     scarcity_weight=1.2,
         #     unlock_weight=0.45,
         #     short_test_bonus_weight=0.55,
+        #     graph=precedence_graph,
         # ),
         # "bottleneck_density": lambda ops: compute_priority_ranks_bottleneck_density(
         #     ops,
@@ -872,12 +1882,17 @@ def main():
         #     density_weight=1.0,
         #     scarcity_weight=0.9,
         #     precedence_weight=0.6,
+        #     graph=precedence_graph,
         # ),
     }
     strategies_to_compare = list(ranking_strategies.keys())
 
     children_by_op = _build_children_map(tests)
-    descendant_counts = _build_descendant_counts(children_by_op)
+    # Descendant counts come from the CSR graph's single reverse-topological sweep
+    # rather than a DFS per operation over children_by_op.
+    descendant_counts = dict(
+        zip(precedence_graph.op_ids, precedence_graph.descendant_counts.tolist())
+    )
     # =========================
     # Schedule scoring settings
     # =========================
@@ -907,91 +1922,67 @@ def main():
         "max_repair_candidates": 24,
         "max_repair_assignments_per_candidate": 16,
         "max_repair_starts_per_assignment": 24,
+        # CP-SAT solve budget and search workers (only used when ortools is installed).
+        "max_cp_sat_runtime_seconds": 30,
+        "cp_sat_workers": 8,
     }
 
-    comparison_results = []
+    # The duration term of a test's value only depends on its duration, so build the
+    # pow table once for every strategy/scheduler evaluation below.
+    weighted_value_cache = _build_duration_pow_table(tests, SCORE_CONFIG)
+
     scheduler_modes = {
         "priority_greedy": {"base_mode": "priority", "repair": False},
         # "enhanced_dispatch_repair": {"base_mode": "enhanced_dispatch", "repair": True},
     }
+    if ORTOOLS_AVAILABLE:
+        # The repair pass picks up anything the model's soak-agnostic plan could not place.
+        scheduler_modes["cp_sat"] = {"base_mode": "cp_sat", "repair": True}
+    comparison_context = {
+        "schedule": schedule,
+        "sites": sites,
+        "start_date": start_date,
+        "end_date": end_date,
+        "ranking_strategies": ranking_strategies,
+        "scheduler_modes": scheduler_modes,
+        "precedence_graph": precedence_graph,
+        "children_by_op": children_by_op,
+        "descendant_counts": descendant_counts,
+        "score_config": SCORE_CONFIG,
+        "performance_config": PERFORMANCE_CONFIG,
+        "weighted_value_cache": weighted_value_cache,
+        "candidate_policy": candidate_policy,
+        "ml_top_k": ml_top_k,
+        "ml_fallback_expand": ml_fallback_expand,
+    }
 
-    # For each ranking strategy, run the scheduler modes and compare the results.
-    for strategy_name in strategies_to_compare:
-        ranked_schedule = deepcopy(schedule)
-        ranked_tests = list(ranked_schedule.operations.values())
-        site_demand_map = ranking_strategies[strategy_name](ranked_tests)
-
-        # For each scheduler mode
-        for scheduler_name, scheduler_cfg in scheduler_modes.items():
-            run_schedule = deepcopy(ranked_schedule)
-
-            if scheduler_cfg["base_mode"] == "priority":
-                unscheduled_tests = _run_greedy_schedule(
-                    run_schedule,
-                    start_date,
-                    end_date,
-                    descendant_counts,
-                    mode="priority",
-                    max_ready_eval=PERFORMANCE_CONFIG["max_ready_eval"],
-                    max_runtime_seconds=PERFORMANCE_CONFIG["max_greedy_runtime_seconds"],
-                    candidate_policy=candidate_policy,
-                    ml_top_k=ml_top_k,
-                    ml_fallback_expand=ml_fallback_expand,
-                )
-            elif scheduler_cfg["base_mode"] == "enhanced_dispatch":
-                unscheduled_tests = _run_greedy_schedule(
-                    run_schedule,
-                    start_date,
-                    end_date,
-                    descendant_counts,
-                    mode="enhanced_dispatch",
-                    max_ready_eval=PERFORMANCE_CONFIG["max_ready_eval"],
-                    max_runtime_seconds=PERFORMANCE_CONFIG["max_greedy_runtime_seconds"],
-                    candidate_policy=candidate_policy,
-                    ml_top_k=ml_top_k,
-                    ml_fallback_expand=ml_fallback_expand,
-                )
-            else:
-                raise ValueError(f"Unknown scheduler mode: {scheduler_cfg['base_mode']}")
-
-            if scheduler_cfg["repair"]:
-                unscheduled_tests, _ = _run_repair_pass(
-                    run_schedule,
-                    unscheduled_tests,
-                    SCORE_CONFIG,
-                    children_by_op,
-                    max_candidates=PERFORMANCE_CONFIG["max_repair_candidates"],
-                    max_assignments_per_candidate=PERFORMANCE_CONFIG["max_repair_assignments_per_candidate"],
-                    max_starts_per_assignment=PERFORMANCE_CONFIG["max_repair_starts_per_assignment"],
-                    max_runtime_seconds=PERFORMANCE_CONFIG["max_repair_runtime_seconds"],
-                )
-
-            stats = run_schedule.get_schedule_statistics()
-            run_metrics = _evaluate_schedule_metrics(
-                run_schedule, list(run_schedule.operations.values()), sites, start_date, end_date, SCORE_CONFIG
-            )
-            scheduled_ops = run_schedule.get_scheduled_operations()
-            comparison_results.append(
-                {
-                    "ranking_strategy": strategy_name,
-                    "scheduler": scheduler_name,
-                    "scheduled_operations": len(scheduled_ops),
-                    "unscheduled_operations": len(unscheduled_tests),
-                    "scheduled_seconds": run_metrics["scheduled_seconds"],
-                    "unscheduled_seconds": run_metrics["unscheduled_seconds"],
-                    "demand_coverage_percent": run_metrics["demand_coverage_percent"],
-                    "priority_weighted_coverage_percent": run_metrics["priority_weighted_coverage_percent"],
-                    "site_capacity_used_percent": run_metrics["site_capacity_used_percent"],
-                    "strategy_score": run_metrics["strategy_score"],
-                    "makespan_hours": stats["makespan_hours"],
-                    "avg_site_utilization": run_metrics["avg_site_utilization"],
-                    "site_demand_map": site_demand_map,
-                    "schedule_snapshot": run_schedule,
-                }
-            )
+    # Every ranking strategy x scheduler mode pair is an independent run.
+    comparison_tasks = [
+        (strategy_name, scheduler_name)
+        for strategy_name in strategies_to_compare
+        for scheduler_name in scheduler_modes
+    ]
+    comparison_workers = _get_comparison_worker_count(len(comparison_tasks))
+    if comparison_workers > 1:
+        print(f"Running {len(comparison_tasks)} comparison runs on {comparison_workers} worker processes.")
+        comparison_runs = _run_comparisons_in_workers(comparison_context, comparison_tasks, comparison_workers)
+    else:
+        comparison_runs = (
+            _run_comparison(comparison_context, strategy_name, scheduler_name)
+            for strategy_name, scheduler_name in comparison_tasks
+        )
 
+    # Rows are printed as runs finish and only the best run is kept alive; losing
+    # runs are dropped as we go instead of holding a full schedule snapshot per
+    # comparison row. Worker runs come back as placements and the winner is
+    # rebuilt once at the end.
     print("\n=== Strategy x Scheduler Comparison ===")
-    for result in comparison_results:
+    best_result = None
+    best_run = None
+    for result, run in comparison_runs:
+        if best_result is None or result["strategy_score"] > best_result["strategy_score"]:
+            best_result = result
+            best_run = run
         print(
             f"  {result['ranking_strategy']} | {result['scheduler']}: "
             f"{result['scheduled_operations']} scheduled, "
@@ -1004,24 +1995,33 @@ def main():
             f"weighted score {result['strategy_score']:.4f}"
         )
 
-    best_result = max(
-        comparison_results,
-        key=lambda r: r["strategy_score"],
-    )
     best_strategy = best_result["ranking_strategy"]
     best_scheduler = best_result["scheduler"]
-    schedule = best_result["schedule_snapshot"]
+    if comparison_workers > 1:
+        schedule = _restore_comparison_schedule(comparison_context, best_strategy, best_run)
+    else:
+        schedule = best_run
     site_demand_map = best_result["site_demand_map"]
-    unscheduled_tests = [op for op in schedule.operations.values() if not op.is_scheduled()]
+    scheduled_ops = schedule.get_scheduled_operations()
+    unscheduled_tests = [
+        op for op_id, op in schedule.operations.items() if op_id not in scheduled_ops
+    ]
     stats = schedule.get_schedule_statistics()
     run_metrics = _evaluate_schedule_metrics(
-        schedule, list(schedule.operations.values()), sites, start_date, end_date, SCORE_CONFIG
+        schedule,
+        list(schedule.operations.values()),
+        sites,
+        start_date,
+        end_date,
+        SCORE_CONFIG,
+        value_cache=weighted_value_cache,
+        scheduled_ops=scheduled_ops,
     )
 
     print("\n=== Selected Best Strategy ===")
     print(f"  Ranking strategy: {best_strategy}")
     print(f"  Scheduler mode: {best_scheduler}")
-    print(f"  Scheduled operations: {len(schedule.get_scheduled_operations())}")
+    print(f"  Scheduled operations: {len(scheduled_ops)}")
     print("\nSchedule quality metrics:")
     print(f"  Priority strategy: {best_strategy}")
     print(
@@ -1061,14 +2061,14 @@ def main():
         for op in unscheduled_tests:
             print(
                 f"  {op.operation_id} "
-                f"(rank {op.metadata.get('priority_rank')}, priority {op.metadata.get('priority', 5)})"
+                f"(rank {getattr(op, 'priority_rank', None)}, priority {op.metadata.get('priority', 5)})"
             )
 
-    show_charts = os.getenv("SCHED_SHOW_CHARTS", "1").strip().lower() not in {"0", "false", "no"}
+    if show_charts is None:
+        show_charts = os.getenv("SCHED_SHOW_CHARTS", "1").strip().lower() not in {"0", "false", "no"}
     if show_charts:
         schedule.create_gantt_chart()
-        schedule.show_visual_gantt_chart(resource_type_filter=["site"], title_suffix="Sites", block=False)
-        schedule.show_visual_gantt_chart(resource_type_filter=["vehicle"], title_suffix="Vehicles", block=True)
+        _show_gantt_charts(schedule)
     else:
         print("Chart rendering skipped (SCHED_SHOW_CHARTS disabled).")
 
@@ -1076,4 +2076,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the vehicle testing scheduling scenario.")
+    chart_group = parser.add_mutually_exclusive_group()
+    chart_group.add_argument("--gantt", dest="show_charts", action="store_const", const=True,
+                             help="Render Gantt charts (overrides SCHED_SHOW_CHARTS).")
+    chart_group.add_argument("--headless", dest="show_charts", action="store_const", const=False,
+                             help="Skip chart rendering; matplotlib is never imported.")
+    args = parser.parse_args()
+    main(show_charts=args.show_charts)
@@ -9,155 +9,285 @@ The hardcoded tests in vehicle_testing_model.py are used as seed templates, then
 
 from __future__ import annotations
 
+import multiprocessing
 import random
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
 
 from classes.operation import Operation
 
 
-def _weighted_choice(rng: random.Random, items: Sequence[str], weights: Sequence[float]) -> str:
-    return rng.choices(items, weights=weights, k=1)[0]
-
-
-def _weighted_unique_sample(
-    rng: random.Random,
-    items: Sequence[str],
-    weights: Sequence[float],
-    k: int,
-) -> List[str]:
-    """Sample k unique items using weighted draws without replacement."""
-    k = max(1, min(k, len(items)))
-    pool_items = list(items)
-    pool_weights = list(weights)
-    selected: List[str] = []
-    for _ in range(k):
-        choice = _weighted_choice(rng, pool_items, pool_weights)
-        idx = pool_items.index(choice)
-        selected.append(choice)
-        pool_items.pop(idx)
-        pool_weights.pop(idx)
-        if not pool_items:
-            break
-    return selected
-
-
-def _extract_resource_ids(base_tests: Iterable[Operation], resource_type: str) -> List[str]:
-    values = set()
-    for op in base_tests:
-        for req in op.get_resource_requirements():
-            if req.get("resource_type") == resource_type:
-                values.update(req.get("possible_resource_ids", []))
-    return sorted(values)
-
-
-def _extract_site_count_distribution() -> Dict[int, float]:
-    # Requested shape: spikes around 1, 2, 3, and 5 options.
-    return {
-        1: 0.24,
-        2: 0.26,
-        3: 0.22,
-        4: 0.05,
-        5: 0.15,
-        6: 0.03,
-        7: 0.02,
-        8: 0.015,
-        9: 0.01,
-        10: 0.005,
-    }
-
-
-def _get_site_weights(base_tests: Sequence[Operation], site_ids: Sequence[str]) -> List[float]:
-    counts = {site_id: 1.0 for site_id in site_ids}
-    for op in base_tests:
-        for req in op.get_resource_requirements():
-            if req.get("resource_type") != "site":
-                continue
-            for site_id in req.get("possible_resource_ids", []):
-                if site_id in counts:
-                    counts[site_id] += 1.0
-    return [counts[site_id] for site_id in site_ids]
+class _WeightedChoice:
+    """
+    Weighted categorical draws with the cumulative distribution built once.
 
+    Generator.choice(p=...) validates p and rebuilds its CDF on every call; this
+    keeps the normalised CDF and maps uniforms to items with searchsorted.
+    """
 
-def _get_vehicle_weights(base_tests: Sequence[Operation], vehicle_ids: Sequence[str], rng: random.Random) -> List[float]:
-    counts = defaultdict(float)
-    for op in base_tests:
-        counts[op.job_id] += 1.0
+    __slots__ = ("items", "cdf")
 
-    # Make a few vehicles "hot" so repeats happen naturally.
-    hot_vehicle_count = max(1, len(vehicle_ids) // 6)
-    hot_vehicles = set(rng.sample(list(vehicle_ids), k=hot_vehicle_count))
-
-    weights: List[float] = []
-    for vehicle_id in vehicle_ids:
-        w = counts.get(vehicle_id, 1.0)
-        if vehicle_id in hot_vehicles:
-            w *= rng.uniform(1.6, 3.0)
-        weights.append(w)
-    return weights
+    def __init__(self, items: Sequence, weights: Sequence[float]):
+        self.items = np.asarray(items)
+        cdf = np.cumsum(np.asarray(weights, dtype=np.float64))
+        self.cdf = cdf / cdf[-1]
 
+    def draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return self.items[np.searchsorted(self.cdf, rng.random(size), side="right")]
 
-def _round_to_quarter_hour(seconds: float) -> float:
-    quarter = 15 * 60
-    rounded = round(seconds / quarter) * quarter
-    return float(max(0.75 * 3600, min(3.5 * 3600, rounded)))
 
+class _AliasTable:
+    """
+    Walker/Vose alias table: O(1) weighted draws after O(n) setup.
 
-def generate_random_test_pool(
-    base_tests: Sequence[Operation],
-    pool_size: int = 500,
-    seed: Optional[int] = None,
-) -> List[Operation]:
+    Each draw picks a column uniformly and keeps it or takes its alias with one
+    biased coin flip, so the cost does not grow with the number of items.
     """
-    Generate a synthetic test pool based on hardcoded tests.
+
+    __slots__ = ("items", "prob", "alias")
+
+    def __init__(self, items: Sequence, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [float(w) * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            short_i = small.pop()
+            long_i = large.pop()
+            prob[short_i] = scaled[short_i]
+            alias[short_i] = long_i
+            scaled[long_i] += scaled[short_i] - 1.0
+            (small if scaled[long_i] < 1.0 else large).append(long_i)
+        # Whatever is left over is 1.0 up to rounding and keeps prob 1.0.
+        self.items = np.asarray(items)
+        self.prob = np.asarray(prob)
+        self.alias = np.asarray(alias, dtype=np.intp)
+
+    def draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        columns = rng.integers(0, len(self.prob), size=size)
+        keep = rng.random(size) < self.prob[columns]
+        return self.items[np.where(keep, columns, self.alias[columns])]
+
+
+# Below this many items a CDF lookup is as fast as the alias table and needs one
+# uniform per draw instead of two.
+_ALIAS_MIN_ITEMS = 32
+
+
+def _weighted_sampler(items: Sequence, weights: Sequence[float]):
+    if len(items) >= _ALIAS_MIN_ITEMS:
+        return _AliasTable(items, weights)
+    return _WeightedChoice(items, weights)
+
+
+def _weighted_unique_orders(rng: np.random.Generator, weights: np.ndarray, rows: int) -> np.ndarray:
     """
-    if not base_tests:
-        return []
+    Weighted draw orders without replacement, one row per sample.
 
-    rng = random.Random(seed)
-    site_ids = _extract_resource_ids(base_tests, "site") or [f"Site_{i}" for i in range(1, 11)]
-    vehicle_ids = _extract_resource_ids(base_tests, "vehicle") or [f"VEHICLE_{i:03d}" for i in range(1, 51)]
-    site_weights = _get_site_weights(base_tests, site_ids)
-    vehicle_weights = _get_vehicle_weights(base_tests, vehicle_ids, rng)
+    Efraimidis-Spirakis A-Res: every item gets the key log(u) / w, and sorting a
+    row by descending key yields the order successive weighted draws without
+    replacement would pick the items, so the first k columns are a weighted
+    unique sample of size k. Weights must be positive.
+    """
+    # log1p(-u) = log(1 - u) with 1 - u in (0, 1], so the log is always defined.
+    keys = np.log1p(-rng.random((rows, len(weights)))) / weights
+    return np.argsort(-keys, axis=1)
 
-    site_count_dist = _extract_site_count_distribution()
-    site_count_values = list(site_count_dist.keys())
-    site_count_weights = list(site_count_dist.values())
 
-    width = max(3, len(str(pool_size)))
-    synthetic_ops: List[Operation] = []
+def _floyd_sample(rng: random.Random, n: int, k: int) -> List[int]:
+    """
+    Floyd's algorithm: k unique indices from range(n) in O(k) time and memory,
+    without materialising the population.
+    """
+    chosen = set()
+    picks: List[int] = []
+    for upper in range(n - k, n):
+        pick = rng.randrange(upper + 1)
+        if pick in chosen:
+            pick = upper
+        chosen.add(pick)
+        picks.append(pick)
+    return picks
+
+
+def _collect_resource_stats(
+    base_tests: Iterable[Operation],
+) -> Tuple[List[str], List[float], List[str], Dict[str, float]]:
+    """
+    Gather everything pool generation needs from the templates in one pass.
+
+    Returns (site_ids, site_weights, vehicle_ids, tests_per_vehicle): sorted site
+    and vehicle ids from the requirements, one weight per site (1 plus its number
+    of appearances as an option) and template counts keyed by job_id.
+    """
+    site_appearances: Dict[str, float] = defaultdict(float)
+    vehicle_ids = set()
+    tests_per_vehicle: Dict[str, float] = defaultdict(float)
+    for op in base_tests:
+        tests_per_vehicle[op.job_id] += 1.0
+        for req in op.get_resource_requirements():
+            resource_type = req.get("resource_type")
+            if resource_type == "site":
+                for site_id in req.get("possible_resource_ids", ()):
+                    site_appearances[site_id] += 1.0
+            elif resource_type == "vehicle":
+                vehicle_ids.update(req.get("possible_resource_ids", ()))
+    site_ids = sorted(site_appearances)
+    site_weights = [1.0 + site_appearances[site_id] for site_id in site_ids]
+    return site_ids, site_weights, sorted(vehicle_ids), tests_per_vehicle
+
+
+# Requested shape: spikes around 1, 2, 3, and 5 site options per test.
+_SITE_COUNT_DISTRIBUTION = {
+    1: 0.24,
+    2: 0.26,
+    3: 0.22,
+    4: 0.05,
+    5: 0.15,
+    6: 0.03,
+    7: 0.02,
+    8: 0.015,
+    9: 0.01,
+    10: 0.005,
+}
+# Built once at import and shared by every pool.
+_SITE_COUNT_CHOICE = _weighted_sampler(
+    tuple(_SITE_COUNT_DISTRIBUTION.keys()), tuple(_SITE_COUNT_DISTRIBUTION.values())
+)
+
+
+def _get_vehicle_weights(
+    tests_per_vehicle: Dict[str, float], vehicle_ids: Sequence[str], rng: np.random.Generator
+) -> np.ndarray:
+    weights = np.fromiter(
+        (tests_per_vehicle.get(vehicle_id, 1.0) for vehicle_id in vehicle_ids),
+        dtype=np.float64,
+        count=len(vehicle_ids),
+    )
+    # Make a few vehicles "hot" so repeats happen naturally; multipliers are
+    # applied in vehicle order.
+    hot_vehicle_count = max(1, len(vehicle_ids) // 6)
+    hot_idx = np.sort(rng.choice(len(vehicle_ids), size=hot_vehicle_count, replace=False))
+    weights[hot_idx] *= rng.uniform(1.6, 3.0, size=hot_vehicle_count)
+    return weights
+
 
-    for idx in range(1, pool_size + 1):
-        template = rng.choice(base_tests)
-        vehicle_id = _weighted_choice(rng, vehicle_ids, vehicle_weights)
+# Durations snap to quarter hours between 0.75h and 3.5h, so the only possible
+# outputs are quarter indices 3..14; table entry q holds q quarter hours in seconds.
+_QUARTER_SECONDS = 15 * 60
+_MIN_QUARTERS, _MAX_QUARTERS = 3, 14
+_QUARTER_TABLE = np.arange(_MAX_QUARTERS + 1, dtype=np.float64) * _QUARTER_SECONDS
 
-        requested_site_count = rng.choices(site_count_values, weights=site_count_weights, k=1)[0]
-        site_count = max(1, min(len(site_ids), requested_site_count))
-        site_options = _weighted_unique_sample(rng, site_ids, site_weights, site_count)
 
-        duration_jitter = rng.uniform(0.85, 1.20)
-        duration = _round_to_quarter_hour(float(template.duration) * duration_jitter)
+def _round_to_quarter_hour(seconds: np.ndarray) -> np.ndarray:
+    quarters = np.rint(seconds / _QUARTER_SECONDS).astype(np.intp)
+    return _QUARTER_TABLE[np.clip(quarters, _MIN_QUARTERS, _MAX_QUARTERS)]
 
-        test_type = template.metadata.get("test_type", rng.choice(["A", "B", "C", "D", "E"]))
-        base_priority = int(template.metadata.get("priority", 3))
-        if rng.random() < 0.25:
-            base_priority += rng.choice([-1, 1])
-        priority = max(1, min(5, base_priority))
 
-        synthetic_ops.append(
-            Operation(
-                operation_id=f"T{idx:0{width}d}",
+class _PoolSpec(NamedTuple):
+    """Fixed inputs shared by every chunk of a synthetic pool."""
+
+    base_tests: Sequence[Operation]
+    site_ids: List[str]
+    vehicle_ids: List[str]
+    site_weights: np.ndarray
+    vehicle_choice: object  # _AliasTable or _WeightedChoice over vehicle indices
+    site_count_choice: object
+    template_durations: np.ndarray
+    template_priorities: np.ndarray
+    template_types: List[Optional[str]]
+    width: int
+
+
+# Pools larger than this are generated in chunks of this many rows, each with its
+# own spawned Generator, so the result does not depend on how many processes run.
+_POOL_CHUNK_ROWS = 1000
+_POOL_SPEC: Optional[_PoolSpec] = None
+
+
+def _generate_pool_rows(
+    spec: _PoolSpec, rng: np.random.Generator, first_row: int, count: int
+) -> List[Operation]:
+    """
+    Build `count` synthetic tests numbered from first_row + 1.
+
+    Every random attribute is drawn for all rows at once; the Python loop only
+    assembles Operations from those arrays.
+    """
+    base_tests = spec.base_tests
+    vehicle_ids = spec.vehicle_ids
+    template_types = spec.template_types
+
+    template_idx = rng.integers(0, len(base_tests), size=count)
+    vehicle_idx = spec.vehicle_choice.draw(rng, count)
+    site_counts = np.clip(spec.site_count_choice.draw(rng, count), 1, len(spec.site_ids))
+    # Map every row's draw order to site ids in one fancy-indexing step; each test
+    # then just slices its leading site_count entries.
+    site_draws = np.asarray(spec.site_ids, dtype=object)[
+        _weighted_unique_orders(rng, spec.site_weights, count)
+    ].tolist()
+    durations = _round_to_quarter_hour(
+        spec.template_durations[template_idx] * rng.uniform(0.85, 1.20, size=count)
+    )
+    priority_nudges = np.where(rng.random(count) < 0.25, rng.choice((-1, 1), size=count), 0)
+    priorities = np.clip(spec.template_priorities[template_idx] + priority_nudges, 1, 5)
+    fallback_types = (
+        rng.choice(["A", "B", "C", "D", "E"], size=count).tolist()
+        if None in template_types
+        else None
+    )
+
+    # Bound once: read for every row in the loop below.
+    width = spec.width
+    template_ids = [template.operation_id for template in base_tests]
+    # Identical site lists recur across rows (short prefixes of similar draws), so
+    # equal ones share a single tuple; each vehicle likewise gets one id tuple.
+    shared_site_ids: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    intern_site_ids = shared_site_ids.setdefault
+    vehicle_id_tuples = [(vehicle_id,) for vehicle_id in vehicle_ids]
+    make_operation = Operation
+    synthetic_ops: List[Operation] = []
+    append_op = synthetic_ops.append
+
+    for row, (template_i, vehicle_i, site_count, duration, priority) in enumerate(
+        zip(
+            template_idx.tolist(),
+            vehicle_idx.tolist(),
+            site_counts.tolist(),
+            durations.tolist(),
+            priorities.tolist(),
+        )
+    ):
+        vehicle_id = vehicle_ids[vehicle_i]
+        site_ids = tuple(site_draws[row][:site_count])
+        test_type = template_types[template_i]
+        if test_type is None:
+            test_type = fallback_types[row]
+
+        operation_id = f"T{first_row + row + 1:0{width}d}"
+        append_op(
+            make_operation(
+                operation_id=operation_id,
                 job_id=vehicle_id,
                 duration=duration,
                 resource_requirements=[
-                    {"resource_type": "site", "possible_resource_ids": site_options},
-                    {"resource_type": "vehicle", "possible_resource_ids": [vehicle_id]},
+                    {"resource_type": "site", "possible_resource_ids": intern_site_ids(site_ids, site_ids)},
+                    {"resource_type": "vehicle", "possible_resource_ids": vehicle_id_tuples[vehicle_i]},
                 ],
                 precedence=[],
                 metadata={
                     "test_type": test_type,
                     "priority": priority,
-                    "source_template": template.operation_id,
+                    "source_template": template_ids[template_i],
+                    "label": operation_id,
                 },
             )
         )
@@ -165,6 +295,77 @@ def generate_random_test_pool(
     return synthetic_ops
 
 
+def _generate_pool_chunk(task) -> List[Operation]:
+    rng, first_row, count = task
+    return _generate_pool_rows(_POOL_SPEC, rng, first_row, count)
+
+
+def generate_random_test_pool(
+    base_tests: Sequence[Operation],
+    pool_size: int = 500,
+    seed: Optional[int] = None,
+    workers: int = 1,
+) -> List[Operation]:
+    """
+    Generate a synthetic test pool based on hardcoded tests.
+
+    Pools above _POOL_CHUNK_ROWS are split into chunks, which run in up to
+    `workers` forked processes when workers > 1. Chunk generators are spawned from
+    the seed, so the pool is the same for any worker count. Returning pickled
+    Operations from workers costs about as much as building them, so parallel
+    runs only pay off for very large pools on several cores.
+    """
+    global _POOL_SPEC
+    if not base_tests:
+        return []
+
+    rng = np.random.default_rng(seed)
+    site_ids, site_weights, vehicle_ids, tests_per_vehicle = _collect_resource_stats(base_tests)
+    if not site_ids:
+        site_ids = [f"Site_{i}" for i in range(1, 11)]
+        site_weights = [1.0] * len(site_ids)
+    if not vehicle_ids:
+        vehicle_ids = [f"VEHICLE_{i:03d}" for i in range(1, 51)]
+    spec = _PoolSpec(
+        base_tests=base_tests,
+        site_ids=site_ids,
+        vehicle_ids=vehicle_ids,
+        site_weights=np.asarray(site_weights),
+        vehicle_choice=_weighted_sampler(
+            range(len(vehicle_ids)), _get_vehicle_weights(tests_per_vehicle, vehicle_ids, rng)
+        ),
+        site_count_choice=_SITE_COUNT_CHOICE,
+        template_durations=np.fromiter((float(t.duration) for t in base_tests), dtype=np.float64),
+        template_priorities=np.fromiter(
+            (int(t.metadata.get("priority", 3)) for t in base_tests), dtype=np.int64
+        ),
+        template_types=[t.metadata.get("test_type") for t in base_tests],
+        width=max(3, len(str(pool_size))),
+    )
+
+    if pool_size <= _POOL_CHUNK_ROWS:
+        return _generate_pool_rows(spec, rng, 0, pool_size)
+
+    first_rows = range(0, pool_size, _POOL_CHUNK_ROWS)
+    tasks = [
+        (chunk_rng, first_row, min(_POOL_CHUNK_ROWS, pool_size - first_row))
+        for chunk_rng, first_row in zip(rng.spawn(len(first_rows)), first_rows)
+    ]
+    workers = min(workers, len(tasks))
+    # Workers inherit the spec through fork; elsewhere the chunks run in-process.
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [op for task in tasks for op in _generate_pool_rows(spec, *task)]
+
+    _POOL_SPEC = spec
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            return [op for chunk in executor.map(_generate_pool_chunk, tasks) for op in chunk]
+    finally:
+        _POOL_SPEC = None
+
+
 def sample_tests_with_safe_precedence(
     test_pool: Sequence[Operation],
     sample_size: int = 120,
@@ -178,50 +379,52 @@ def sample_tests_with_safe_precedence(
     if not test_pool:
         return []
 
-    rng = random.Random(seed)
-    sampled = list(rng.sample(list(test_pool), k=min(sample_size, len(test_pool))))
-
-    # Recreate operations to keep sampled runs fully isolated.
-    sampled_by_id: Dict[str, Operation] = {}
+    # test_pool is indexed in place; no copy of the population is made. The sample
+    # is re-sorted by id below, so taking the whole pool needs no draws at all.
+    sample_count = min(sample_size, len(test_pool))
+    if sample_count == len(test_pool):
+        sampled = test_pool
+    else:
+        rng = random.Random(seed)
+        sampled = [test_pool[idx] for idx in _floyd_sample(rng, len(test_pool), sample_count)]
+
+    # Recreate operations so scheduling state, precedence and metadata written
+    # during a run stay isolated from the pool. Resource requirements are fixed
+    # once an Operation is built, so the clones share them with the pool entries.
+    # Operation has __slots__, so the numeric id suffix used for ordering is
+    # parsed once here and kept next to each clone rather than on it.
+    sampled_by_id: Dict[str, Tuple[int, Operation]] = {}
     for op in sampled:
         cloned = Operation(
             operation_id=op.operation_id,
             job_id=op.job_id,
             duration=float(op.duration),
-            resource_requirements=[
-                {
-                    "resource_type": req.get("resource_type"),
-                    "possible_resource_ids": list(req.get("possible_resource_ids", [])),
-                }
-                for req in op.get_resource_requirements()
-            ],
+            resource_requirements=op.get_resource_requirements(),
             precedence=[],
             metadata=dict(op.metadata),
         )
-        sampled_by_id[cloned.operation_id] = cloned
-
-    sampled_ops = list(sampled_by_id.values())
-    sampled_ops.sort(key=lambda op: int(op.operation_id[1:]))
-
-    ops_by_vehicle: Dict[str, List[Operation]] = defaultdict(list)
-    for op in sampled_ops:
-        ops_by_vehicle[op.job_id].append(op)
-
+        sampled_by_id[cloned.operation_id] = (int(op.operation_id[1:]), cloned)
+
+    sampled_ops = [cloned for _, cloned in sorted(sampled_by_id.values(), key=itemgetter(0))]
+
+    # A stable sort by vehicle keeps each vehicle's tests in id order, so every
+    # adjacent pair inside a group is a candidate edge.
+    candidate_edges = []
+    by_vehicle = sorted(sampled_ops, key=attrgetter("job_id"))
+    for _, vehicle_ops in groupby(by_vehicle, key=attrgetter("job_id")):
+        pred = next(vehicle_ops)
+        for succ in vehicle_ops:
+            candidate_edges.append((pred, succ))
+            pred = succ
+
+    # One coin per candidate edge, drawn in a single batch from a NumPy generator
+    # on the same seed; the first max_edges successes become edges. Each clone
+    # starts with its own empty precedence list and gains at most one edge.
     max_edges = int(len(sampled_ops) * precedence_edge_ratio_cap)
-    edges_added = 0
-
-    for vehicle_ops in ops_by_vehicle.values():
-        if len(vehicle_ops) < 2:
-            continue
-        for idx in range(1, len(vehicle_ops)):
-            if edges_added >= max_edges:
-                break
-            if rng.random() > precedence_probability:
-                continue
-            pred = vehicle_ops[idx - 1]
-            succ = vehicle_ops[idx]
-            succ.precedence = [pred.operation_id]
-            edges_added += 1
+    coins = np.random.default_rng(seed).random(len(candidate_edges))
+    for edge_idx in np.flatnonzero(coins <= precedence_probability)[:max_edges].tolist():
+        pred, succ = candidate_edges[edge_idx]
+        succ.precedence.append(pred.operation_id)
 
     return sampled_ops
 
@@ -231,11 +434,12 @@ def generate_sampled_tests(
     pool_size: int = 500,
     sample_size: int = 120,
     seed: Optional[int] = None,
+    pool_workers: int = 1,
 ) -> List[Operation]:
     """
     Full pipeline: build random pool then sample subset with safe precedence.
     """
-    pool = generate_random_test_pool(base_tests, pool_size=pool_size, seed=seed)
+    pool = generate_random_test_pool(base_tests, pool_size=pool_size, seed=seed, workers=pool_workers)
     # Use a derived seed so pool generation + sampling are independently stable.
     sample_seed = None if seed is None else seed + 1
     return sample_tests_with_safe_precedence(pool, sample_size=sample_size, seed=sample_seed)
@@ -3,8 +3,9 @@ Vehicle emissions testing scheduling problem model.
 Defines schedule, resources, tests, jobs, and constraints.
 """
 
-from datetime import datetime, timedelta, time
-from collections import defaultdict
+from datetime import datetime, time
+from functools import lru_cache
+from itertools import chain
 import sys
 import os
 
@@ -22,6 +23,218 @@ from classes.constraints import ChangeoverConstraint, ShiftConstraint, SoakConst
 from constraint_config import SCHEDULE_CONFIG, CONSTRAINT_CONFIG, DURATION_ADJUSTMENT_CONFIG
 from random_vehicle_tests import generate_sampled_tests
 
+# Resource type names shared by every test's requirements and the constraint filters.
+SITE, VEHICLE = sys.intern("site"), sys.intern("vehicle")
+
+_SECONDS_PER_HOUR = 3600.0
+
+# Base test catalog, one row per test:
+# (operation_id, job_id, duration hours, candidate site numbers, precedence,
+#  test_type, priority, soak_hours or None). Each test needs one of its candidate
+# sites plus its own vehicle.
+_TEST_SPECS = (
+    ("T001", "VEHICLE_001", 2.0, (1, 2, 3), (), "A", 1, None),
+    ("T002", "VEHICLE_001", 1.5, (2, 4), ("T001",), "B", 2, None),
+    ("T003", "VEHICLE_002", 2.0, (1, 3), (), "A", 3, None),
+    ("T004", "VEHICLE_003", 3.0, (4, 5), (), "C", 1, None),
+    ("T005", "VEHICLE_001", 1.0, (1, 3), (), "D", 3, None),
+    ("T006", "VEHICLE_002", 1.5, (2, 5), (), "B", 2, None),
+    ("T007", "VEHICLE_002", 2.5, (3, 4), (), "C", 4, None),
+    ("T008", "VEHICLE_003", 1.5, (1, 2), (), "A", 2, None),
+    ("T009", "VEHICLE_003", 0.75, (5,), ("T004",), "E", 1, None),
+    ("T010", "VEHICLE_004", 1.75, (1, 4, 5), (), "A", 2, None),
+    ("T011", "VEHICLE_005", 1.0, (1, 4, 5), (), "E", 2, None),
+    ("T012", "VEHICLE_006", 1.5, (1, 4, 5), (), "E", 3, None),
+    ("T013", "VEHICLE_007", 2.25, (2, 3), (), "A", 2, None),
+    ("T014", "VEHICLE_008", 1.5, (1, 5), (), "B", 1, None),
+    ("T015", "VEHICLE_009", 2.75, (3, 4, 5), (), "C", 3, None),
+    ("T016", "VEHICLE_001", 1.5, (2, 3), ("T002",), "E", 2, 4),
+    ("T017", "VEHICLE_003", 1.0, (1, 4), ("T008",), "B", 2, None),
+    ("T018", "VEHICLE_010", 1.5, (1, 2), (), "A", 2, None),
+    ("T019", "VEHICLE_011", 2.25, (3, 4), (), "B", 3, None),
+    ("T020", "VEHICLE_012", 1.0, (2, 5), (), "C", 1, None),
+    ("T021", "VEHICLE_013", 2.0, (1, 4, 5), (), "D", 4, None),
+    ("T022", "VEHICLE_014", 1.0, (3, 5), (), "E", 2, None),
+    ("T023", "VEHICLE_015", 1.5, (1, 3), (), "A", 1, None),
+    ("T024", "VEHICLE_016", 2.5, (2, 4), (), "B", 3, 4),
+    ("T025", "VEHICLE_017", 1.75, (4, 5), (), "C", 2, None),
+    ("T026", "VEHICLE_018", 2.0, (1, 2, 3), (), "D", 4, None),
+    ("T027", "VEHICLE_019", 2.0, (2, 5), (), "E", 2, None),
+    ("T028", "VEHICLE_020", 1.5, (1, 2, 3), (), "A", 2, None),
+    ("T029", "VEHICLE_021", 2.0, (3, 5), (), "B", 3, None),
+    ("T030", "VEHICLE_022", 1.75, (2, 4), (), "C", 1, None),
+    ("T031", "VEHICLE_023", 1.5, (1, 4, 5), (), "D", 4, None),
+    ("T032", "VEHICLE_024", 2.25, (2, 5), (), "E", 2, None),
+    ("T033", "VEHICLE_004", 1.25, (1, 4), ("T010",), "B", 2, 2),
+    ("T034", "VEHICLE_005", 1.5, (3, 5), (), "C", 3, None),
+    ("T035", "VEHICLE_006", 2.0, (2, 4, 5), ("T012",), "D", 2, None),
+    ("T036", "VEHICLE_007", 1.0, (2, 3), (), "E", 1, None),
+    ("T037", "VEHICLE_008", 1.0, (1, 5), ("T014",), "A", 2, 4),
+    ("T038", "VEHICLE_009", 1.5, (4, 5), ("T015",), "B", 1, 3),
+    ("T039", "VEHICLE_010", 1.5, (1, 2, 3), (), "C", 2, None),
+    ("T040", "VEHICLE_011", 1.75, (3, 4), ("T019",), "D", 3, None),
+    ("T041", "VEHICLE_012", 1.0, (2, 5), (), "E", 1, None),
+    ("T042", "VEHICLE_013", 2.25, (1, 4, 5), ("T021",), "A", 2, None),
+    ("T043", "VEHICLE_014", 1.0, (3, 5), (), "B", 3, None),
+    ("T044", "VEHICLE_015", 1.5, (1, 3), ("T023",), "C", 2, None),
+    ("T045", "VEHICLE_016", 1.75, (2, 4, 5), (), "D", 4, None),
+    ("T046", "VEHICLE_017", 1.5, (4, 5), ("T025",), "E", 2, None),
+    ("T047", "VEHICLE_018", 1.0, (1, 2, 3), (), "A", 1, None),
+    ("T048", "VEHICLE_019", 1.5, (2, 5), ("T027",), "B", 2, None),
+    ("T049", "VEHICLE_020", 1.0, (1, 2, 3), (), "C", 3, None),
+    ("T050", "VEHICLE_021", 3.0, (3, 5), ("T029",), "D", 2, None),
+    ("T051", "VEHICLE_022", 1.5, (2, 4), ("T030",), "E", 1, 2),
+    ("T052", "VEHICLE_024", 1.5, (2, 5), (), "A", 3, None),
+    ("T053", "VEHICLE_025", 0.75, (1, 4, 7), (), "A", 1, None),
+    ("T054", "VEHICLE_025", 1.0, (2, 5), ("T053",), "B", 2, None),
+    ("T055", "VEHICLE_025", 1.25, (3, 6), (), "C", 2, 2),
+    ("T056", "VEHICLE_025", 1.5, (4, 7, 10), ("T055",), "D", 3, None),
+    ("T057", "VEHICLE_026", 1.25, (2, 5), (), "B", 2, None),
+    ("T058", "VEHICLE_026", 1.5, (3, 6), ("T057",), "C", 2, None),
+    ("T059", "VEHICLE_026", 2.0, (4, 7, 10), (), "D", 3, None),
+    ("T060", "VEHICLE_026", 2.25, (5, 8), ("T059",), "E", 4, None),
+    ("T061", "VEHICLE_027", 2.0, (3, 6), (), "C", 2, None),
+    ("T062", "VEHICLE_027", 2.25, (4, 7, 10), ("T061",), "D", 3, None),
+    ("T063", "VEHICLE_027", 0.75, (5, 8), (), "E", 4, None),
+    ("T064", "VEHICLE_028", 0.75, (4, 7, 10), (), "D", 3, None),
+    ("T065", "VEHICLE_028", 1.0, (5, 8), ("T064",), "E", 4, None),
+    ("T066", "VEHICLE_028", 1.25, (6, 9), (), "A", 1, None),
+    ("T067", "VEHICLE_029", 1.25, (5, 8), (), "E", 4, None),
+    ("T068", "VEHICLE_029", 1.5, (6, 9), ("T067",), "A", 1, None),
+    ("T069", "VEHICLE_029", 2.0, (7, 10, 3), (), "B", 2, 2),
+    ("T070", "VEHICLE_030", 2.0, (6, 9), (), "A", 1, None),
+    ("T071", "VEHICLE_030", 2.25, (7, 10, 3), ("T070",), "B", 2, None),
+    ("T072", "VEHICLE_030", 0.75, (8, 1), (), "C", 2, None),
+    ("T073", "VEHICLE_031", 0.75, (7, 10, 3), (), "B", 2, None),
+    ("T074", "VEHICLE_031", 1.0, (8, 1), ("T073",), "C", 2, None),
+    ("T075", "VEHICLE_031", 1.25, (9, 2), (), "D", 3, None),
+    ("T076", "VEHICLE_032", 1.25, (8, 1), (), "C", 2, None),
+    ("T077", "VEHICLE_032", 1.5, (9, 2), ("T076",), "D", 3, None),
+    ("T078", "VEHICLE_032", 2.0, (10, 3, 6), (), "E", 4, None),
+    ("T079", "VEHICLE_033", 2.0, (9, 2), (), "D", 3, None),
+    ("T080", "VEHICLE_033", 2.25, (10, 3, 6), ("T079",), "E", 4, None),
+    ("T081", "VEHICLE_033", 1.75, (1, 4), (), "A", 1, 2),
+    ("T082", "VEHICLE_034", 1.0, (10, 3, 6), (), "E", 4, None),
+    ("T083", "VEHICLE_034", 1.0, (1, 4), ("T082",), "A", 1, None),
+    ("T084", "VEHICLE_034", 1.25, (2, 5), (), "B", 2, None),
+    ("T085", "VEHICLE_035", 1.25, (1, 4), (), "A", 1, None),
+    ("T086", "VEHICLE_035", 1.5, (2, 5), ("T085",), "B", 2, None),
+    ("T087", "VEHICLE_035", 2.0, (3, 6, 9), (), "C", 2, None),
+    ("T088", "VEHICLE_036", 2.0, (2, 5), (), "B", 2, None),
+    ("T089", "VEHICLE_036", 2.25, (3, 6, 9), ("T088",), "C", 2, None),
+    ("T090", "VEHICLE_036", 2.75, (4, 7), (), "D", 3, None),
+    ("T091", "VEHICLE_037", 1.25, (3, 6, 9), (), "C", 2, None),
+    ("T092", "VEHICLE_037", 1.0, (4, 7), ("T091",), "D", 3, None),
+    ("T093", "VEHICLE_037", 1.25, (5, 8), (), "E", 4, 2),
+    ("T094", "VEHICLE_038", 1.25, (4, 7), (), "D", 3, None),
+    ("T095", "VEHICLE_038", 1.5, (5, 8), ("T094",), "E", 4, None),
+    ("T096", "VEHICLE_038", 2.0, (6, 9, 2), (), "A", 1, None),
+    ("T097", "VEHICLE_039", 2.0, (5, 8), (), "E", 4, None),
+    ("T098", "VEHICLE_039", 2.25, (6, 9, 2), ("T097",), "A", 1, None),
+    ("T099", "VEHICLE_039", 0.75, (7, 10), (), "B", 2, None),
+    ("T100", "VEHICLE_040", 0.75, (6, 9, 2), (), "A", 1, None),
+    ("T101", "VEHICLE_040", 1.0, (7, 10), ("T100",), "B", 2, None),
+    ("T102", "VEHICLE_040", 1.25, (8, 1), (), "C", 2, None),
+    ("T103", "VEHICLE_041", 1.0, (1, 2, 3, 4, 6, 8, 10), (), "D", 3, None),
+    ("T104", "VEHICLE_041", 1.75, (1, 2, 3, 5, 7, 8, 9, 10), (), "E", 4, None),
+    ("T105", "VEHICLE_042", 1.5, (1, 3, 4, 5, 6, 8, 9), (), "A", 5, None),
+    ("T106", "VEHICLE_042", 2.0, (2, 3, 4, 5, 6, 7, 9, 10), (), "B", 3, None),
+    ("T107", "VEHICLE_043", 1.25, (1, 2, 4, 5, 7, 8, 10), (), "C", 4, None),
+    ("T108", "VEHICLE_043", 1.75, (1, 2, 3, 4, 6, 7, 9, 10), (), "D", 5, None),
+    ("T109", "VEHICLE_044", 1.0, (2, 3, 4, 5, 6, 8, 9), (), "E", 3, None),
+    ("T110", "VEHICLE_044", 1.5, (1, 3, 4, 5, 7, 8, 9, 10), (), "A", 4, None),
+    ("T111", "VEHICLE_045", 1.25, (1, 2, 3, 5, 6, 8, 10), (), "B", 5, None),
+    ("T112", "VEHICLE_045", 2.0, (2, 3, 4, 6, 7, 8, 9, 10), (), "C", 3, None),
+    ("T113", "VEHICLE_046", 1.0, (1, 2, 4, 5, 6, 7, 9), (), "D", 4, None),
+    ("T114", "VEHICLE_046", 1.5, (1, 3, 4, 5, 6, 8, 9, 10), (), "E", 5, None),
+    ("T115", "VEHICLE_047", 1.25, (2, 3, 4, 5, 7, 8, 10), (), "A", 3, None),
+    ("T116", "VEHICLE_047", 1.75, (1, 2, 3, 4, 6, 7, 8, 9), (), "B", 4, None),
+    ("T117", "VEHICLE_048", 1.0, (1, 2, 4, 5, 6, 8, 9), (), "C", 5, None),
+    ("T118", "VEHICLE_048", 2.0, (2, 3, 4, 5, 6, 7, 9, 10), (), "D", 3, None),
+    ("T119", "VEHICLE_049", 1.25, (1, 3, 4, 5, 6, 8, 10), (), "E", 4, None),
+    ("T120", "VEHICLE_049", 1.5, (1, 2, 3, 4, 6, 7, 8, 9), (), "A", 5, None),
+    ("T121", "VEHICLE_050", 1.0, (2, 3, 4, 5, 7, 8, 10), (), "B", 3, None),
+    ("T122", "VEHICLE_050", 1.75, (1, 2, 3, 4, 6, 7, 9, 10), (), "C", 4, None),
+)
+
+# Candidate site ids for each spec row, formatted once at import. Rows with the
+# same candidate sites share one tuple.
+_SITE_ID_TUPLES = {}
+_TEST_SITE_IDS = tuple(
+    _SITE_ID_TUPLES.setdefault(spec[3], tuple(f"Site_{i}" for i in spec[3])) for spec in _TEST_SPECS
+)
+
+
+@lru_cache(maxsize=1)
+def _build_base_tests():
+    """
+    Build the base test operations from _TEST_SPECS.
+
+    The base tests only seed the random pool and are never scheduled or
+    mutated, so one shared tuple serves every build.
+    """
+    return tuple(
+        Operation(
+            operation_id=operation_id,
+            job_id=job_id,
+            duration=hours * _SECONDS_PER_HOUR,
+            resource_requirements=[
+                {"resource_type": SITE, "possible_resource_ids": site_ids},
+                {"resource_type": VEHICLE, "possible_resource_ids": (job_id,)},
+            ],
+            precedence=list(precedence),
+            metadata=(
+                {"test_type": test_type, "priority": priority}
+                if soak_hours is None
+                else {"test_type": test_type, "priority": priority, "soak_hours": soak_hours}
+            ),
+        )
+        for (operation_id, job_id, hours, _, precedence, test_type, priority, soak_hours), site_ids in zip(
+            _TEST_SPECS, _TEST_SITE_IDS
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_constraints():
+    """
+    Build the constraints from CONSTRAINT_CONFIG on first use.
+
+    The constraints hold only configuration (plus the shift constraint's
+    per-day window memo), so every schedule built here shares the same objects.
+    """
+    shift_windows = {
+        shift_name: (time(start_h, start_m), time(end_h, end_m))
+        for shift_name, ((start_h, start_m), (end_h, end_m)) in CONSTRAINT_CONFIG["shift_windows"].items()
+    }
+    constraints = [
+        ShiftConstraint(
+            shift_windows=list(shift_windows.values()),
+            mode=CONSTRAINT_CONFIG["shift_mode"],
+            resource_type_filter=CONSTRAINT_CONFIG["shift_resource_type_filter"],
+        ),
+        # Changeover at sites when switching vehicles (no changeover when same vehicle)
+        ChangeoverConstraint(
+            changeover_minutes=CONSTRAINT_CONFIG["site_changeover_minutes"],
+            key_from="assigned_resource",
+            key_field=VEHICLE,
+            resource_type_filter=[SITE],
+        ),
+        # Transfer time between sites for the same vehicle
+        ChangeoverConstraint(
+            changeover_minutes=CONSTRAINT_CONFIG["vehicle_transfer_minutes"],
+            key_from="assigned_resource",
+            key_field=SITE,
+            resource_type_filter=[VEHICLE],
+        ),
+    ]
+
+    # Soak lag for specific tests only (via metadata, e.g. soak_hours).
+    if CONSTRAINT_CONFIG["enable_soak_constraint"]:
+        constraints.append(SoakConstraint())
+
+    return tuple(constraints)
+
 
 def build_vehicle_testing_problem():
     """
@@ -75,1430 +288,40 @@ def build_vehicle_testing_problem():
     )
 
     # Resources: sites/garages with different equipment
-    sites = [Resource(f"Site_{i}", "site", f"Site {i}") for i in range(1, 11)]
-    vehicles = [Resource(f"VEHICLE_{i:03d}", "vehicle", f"Vehicle {i:03d}") for i in range(1, 51)]
+    sites = [Resource(f"Site_{i}", SITE, f"Site {i}") for i in range(1, 11)]
+    vehicles = [Resource(f"VEHICLE_{i:03d}", VEHICLE, f"Vehicle {i:03d}") for i in range(1, 51)]
 
-    for site in sites:
-        schedule.add_resource(site);
+    schedule.add_resources(chain(sites, vehicles))
 
-    for vehicle in vehicles:
-        schedule.add_resource(vehicle);
+    # Example tests for vehicles (each test is an operation), sampled from a
+    # random pool grown out of the base test catalog.
+    tests = generate_sampled_tests(
+        base_tests=_build_base_tests(),
+        pool_size=int(SCHEDULE_CONFIG.get("random_test_pool_size", 500)),
+        sample_size=int(SCHEDULE_CONFIG.get("selected_test_count", 120)),
+        seed=SCHEDULE_CONFIG.get("random_test_seed"),
+        pool_workers=int(SCHEDULE_CONFIG.get("random_test_pool_workers", 1)),
+    )
 
+    # Jobs are vehicles; group operations by job_id so test additions stay maintenance-free.
+    # Sampled tests arrive in test-id order, so each job's list is already ordered;
+    # only the job ids need sorting (they are zero-padded, so this is vehicle order).
+    if __debug__:
+        test_numbers = [int(op.operation_id[1:]) for op in tests]
+        assert test_numbers == sorted(test_numbers), "sampled tests must be in test-id order"
+    tests_by_job_id = {}
+    for op in tests:
+        tests_by_job_id.setdefault(op.job_id, []).append(op)
+    for job_id, job_ops in sorted(tests_by_job_id.items()):
+        schedule.add_job(
+            Job(
+                job_id,
+                job_ops,
+                metadata={"vehicle": job_id.replace("VEHICLE_", "V")},
+            )
+        )
 
-    # Example tests for vehicles (each test is an operation)
-    tests = [
-        Operation(
-            operation_id="T001",
-            job_id="VEHICLE_001",
-            duration=timedelta(hours=2).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_001"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T002",
-            job_id="VEHICLE_001",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_001"]},
-            ],
-            precedence=["T001"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T003",
-            job_id="VEHICLE_002",
-            duration=timedelta(hours=2).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_002"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 3},
-        ),
-        Operation(
-            operation_id="T004",
-            job_id="VEHICLE_003",
-            duration=timedelta(hours=3).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_003"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 1},
-        ),
-        Operation(
-            operation_id="T005",
-            job_id="VEHICLE_001",
-            duration=timedelta(hours=1).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_001"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T006",
-            job_id="VEHICLE_002",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_002"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T007",
-            job_id="VEHICLE_002",
-            duration=timedelta(hours=2.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_002"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 4},
-        ),
-        Operation(
-            operation_id="T008",
-            job_id="VEHICLE_003",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_003"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T009",
-            job_id="VEHICLE_003",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_003"]},
-            ],
-            precedence=["T004"],
-            metadata={"test_type": "E", "priority": 1},
-        ),
-        Operation(
-            operation_id="T010",
-            job_id="VEHICLE_004",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_004"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T011",
-            job_id="VEHICLE_005",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_005"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 2},
-        ),
-        Operation(
-            operation_id="T012",
-            job_id="VEHICLE_006",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_006"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 3},
-        ),
-        Operation(
-            operation_id="T013",
-            job_id="VEHICLE_007",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_007"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T014",
-            job_id="VEHICLE_008",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_008"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 1},
-        ),
-        Operation(
-            operation_id="T015",
-            job_id="VEHICLE_009",
-            duration=timedelta(hours=2.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_009"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 3},
-        ),
-        Operation(
-            operation_id="T016",
-            job_id="VEHICLE_001",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_001"]},
-            ],
-            precedence=["T002"],
-            metadata={"test_type": "E", "priority": 2, "soak_hours": 4},
-        ),
-        Operation(
-            operation_id="T017",
-            job_id="VEHICLE_003",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_003"]},
-            ],
-            precedence=["T008"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T018",
-            job_id="VEHICLE_010",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_010"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T019",
-            job_id="VEHICLE_011",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_011"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3},
-        ),
-        Operation(
-            operation_id="T020",
-            job_id="VEHICLE_012",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_012"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 1},
-        ),
-        Operation(
-            operation_id="T021",
-            job_id="VEHICLE_013",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_013"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 4},
-        ),
-        Operation(
-            operation_id="T022",
-            job_id="VEHICLE_014",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_014"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 2},
-        ),
-        Operation(
-            operation_id="T023",
-            job_id="VEHICLE_015",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_015"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T024",
-            job_id="VEHICLE_016",
-            duration=timedelta(hours=2.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_016"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3, "soak_hours": 4},
-        ),
-        Operation(
-            operation_id="T025",
-            job_id="VEHICLE_017",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_017"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T026",
-            job_id="VEHICLE_018",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_018"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 4},
-        ),
-        Operation(
-            operation_id="T027",
-            job_id="VEHICLE_019",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_019"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 2},
-        ),
-        Operation(
-            operation_id="T028",
-            job_id="VEHICLE_020",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_020"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T029",
-            job_id="VEHICLE_021",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_021"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3},
-        ),
-        Operation(
-            operation_id="T030",
-            job_id="VEHICLE_022",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_022"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 1},
-        ),
-        Operation(
-            operation_id="T031",
-            job_id="VEHICLE_023",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_023"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 4},
-        ),
-        Operation(
-            operation_id="T032",
-            job_id="VEHICLE_024",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_024"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 2},
-        ),
-        Operation(
-            operation_id="T033",
-            job_id="VEHICLE_004",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_004"]},
-            ],
-            precedence=["T010"],
-            metadata={"test_type": "B", "priority": 2, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T034",
-            job_id="VEHICLE_005",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_005"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 3},
-        ),
-        Operation(
-            operation_id="T035",
-            job_id="VEHICLE_006",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_006"]},
-            ],
-            precedence=["T012"],
-            metadata={"test_type": "D", "priority": 2},
-        ),
-        Operation(
-            operation_id="T036",
-            job_id="VEHICLE_007",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_007"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 1},
-        ),
-        Operation(
-            operation_id="T037",
-            job_id="VEHICLE_008",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_008"]},
-            ],
-            precedence=["T014"],
-            metadata={"test_type": "A", "priority": 2, "soak_hours": 4},
-        ),
-        Operation(
-            operation_id="T038",
-            job_id="VEHICLE_009",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_009"]},
-            ],
-            precedence=["T015"],
-            metadata={"test_type": "B", "priority": 1, "soak_hours": 3},
-        ),
-        Operation(
-            operation_id="T039",
-            job_id="VEHICLE_010",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_010"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T040",
-            job_id="VEHICLE_011",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_011"]},
-            ],
-            precedence=["T019"],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T041",
-            job_id="VEHICLE_012",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_012"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 1},
-        ),
-        Operation(
-            operation_id="T042",
-            job_id="VEHICLE_013",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_013"]},
-            ],
-            precedence=["T021"],
-            metadata={"test_type": "A", "priority": 2},
-        ),
-        Operation(
-            operation_id="T043",
-            job_id="VEHICLE_014",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_014"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3},
-        ),
-        Operation(
-            operation_id="T044",
-            job_id="VEHICLE_015",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_015"]},
-            ],
-            precedence=["T023"],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T045",
-            job_id="VEHICLE_016",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_016"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 4},
-        ),
-        Operation(
-            operation_id="T046",
-            job_id="VEHICLE_017",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_017"]},
-            ],
-            precedence=["T025"],
-            metadata={"test_type": "E", "priority": 2},
-        ),
-        Operation(
-            operation_id="T047",
-            job_id="VEHICLE_018",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_018"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T048",
-            job_id="VEHICLE_019",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_019"]},
-            ],
-            precedence=["T027"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T049",
-            job_id="VEHICLE_020",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_020"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 3},
-        ),
-        Operation(
-            operation_id="T050",
-            job_id="VEHICLE_021",
-            duration=timedelta(hours=3.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_021"]},
-            ],
-            precedence=["T029"],
-            metadata={"test_type": "D", "priority": 2},
-        ),
-        Operation(
-            operation_id="T051",
-            job_id="VEHICLE_022",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_022"]},
-            ],
-            precedence=["T030"],
-            metadata={"test_type": "E", "priority": 1, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T052",
-            job_id="VEHICLE_024",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_024"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 3},
-        ),
-    ]
-
-    # Explicit tests T053–T102 (static entries, same values as previous generation logic)
-    tests.extend([
-        Operation(
-            operation_id="T053",
-            job_id="VEHICLE_025",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4", "Site_7"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_025"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T054",
-            job_id="VEHICLE_025",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_025"]},
-            ],
-            precedence=["T053"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T055",
-            job_id="VEHICLE_025",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_025"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T056",
-            job_id="VEHICLE_025",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_025"]},
-            ],
-            precedence=["T055"],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T057",
-            job_id="VEHICLE_026",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_026"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T058",
-            job_id="VEHICLE_026",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_026"]},
-            ],
-            precedence=["T057"],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T059",
-            job_id="VEHICLE_026",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_026"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T060",
-            job_id="VEHICLE_026",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_026"]},
-            ],
-            precedence=["T059"],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T061",
-            job_id="VEHICLE_027",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_027"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T062",
-            job_id="VEHICLE_027",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_027"]},
-            ],
-            precedence=["T061"],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T063",
-            job_id="VEHICLE_027",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_027"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T064",
-            job_id="VEHICLE_028",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_028"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T065",
-            job_id="VEHICLE_028",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_028"]},
-            ],
-            precedence=["T064"],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T066",
-            job_id="VEHICLE_028",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_028"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T067",
-            job_id="VEHICLE_029",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_029"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T068",
-            job_id="VEHICLE_029",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_029"]},
-            ],
-            precedence=["T067"],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T069",
-            job_id="VEHICLE_029",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_7", "Site_10", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_029"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T070",
-            job_id="VEHICLE_030",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_030"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T071",
-            job_id="VEHICLE_030",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_7", "Site_10", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_030"]},
-            ],
-            precedence=["T070"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T072",
-            job_id="VEHICLE_030",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_8", "Site_1"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_030"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T073",
-            job_id="VEHICLE_031",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_7", "Site_10", "Site_3"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_031"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T074",
-            job_id="VEHICLE_031",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_8", "Site_1"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_031"]},
-            ],
-            precedence=["T073"],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T075",
-            job_id="VEHICLE_031",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_031"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T076",
-            job_id="VEHICLE_032",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_8", "Site_1"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_032"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T077",
-            job_id="VEHICLE_032",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_032"]},
-            ],
-            precedence=["T076"],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T078",
-            job_id="VEHICLE_032",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_10", "Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_032"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T079",
-            job_id="VEHICLE_033",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_033"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T080",
-            job_id="VEHICLE_033",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_10", "Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_033"]},
-            ],
-            precedence=["T079"],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T081",
-            job_id="VEHICLE_033",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_033"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T082",
-            job_id="VEHICLE_034",
-            duration=timedelta(hours=1).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_10", "Site_3", "Site_6"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_034"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T083",
-            job_id="VEHICLE_034",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_034"]},
-            ],
-            precedence=["T082"],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T084",
-            job_id="VEHICLE_034",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_034"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T085",
-            job_id="VEHICLE_035",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_4"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_035"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T086",
-            job_id="VEHICLE_035",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_035"]},
-            ],
-            precedence=["T085"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T087",
-            job_id="VEHICLE_035",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_035"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T088",
-            job_id="VEHICLE_036",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_5"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_036"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T089",
-            job_id="VEHICLE_036",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_036"]},
-            ],
-            precedence=["T088"],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T090",
-            job_id="VEHICLE_036",
-            duration=timedelta(hours=2.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_036"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T091",
-            job_id="VEHICLE_037",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_3", "Site_6", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_037"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T092",
-            job_id="VEHICLE_037",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_037"]},
-            ],
-            precedence=["T091"],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T093",
-            job_id="VEHICLE_037",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_037"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4, "soak_hours": 2},
-        ),
-        Operation(
-            operation_id="T094",
-            job_id="VEHICLE_038",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_4", "Site_7"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_038"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T095",
-            job_id="VEHICLE_038",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_038"]},
-            ],
-            precedence=["T094"],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T096",
-            job_id="VEHICLE_038",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_038"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T097",
-            job_id="VEHICLE_039",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_5", "Site_8"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_039"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T098",
-            job_id="VEHICLE_039",
-            duration=timedelta(hours=2.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_039"]},
-            ],
-            precedence=["T097"],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T099",
-            job_id="VEHICLE_039",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_039"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T100",
-            job_id="VEHICLE_040",
-            duration=timedelta(hours=0.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_6", "Site_9", "Site_2"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_040"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 1},
-        ),
-        Operation(
-            operation_id="T101",
-            job_id="VEHICLE_040",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_7", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_040"]},
-            ],
-            precedence=["T100"],
-            metadata={"test_type": "B", "priority": 2},
-        ),
-        Operation(
-            operation_id="T102",
-            job_id="VEHICLE_040",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_8", "Site_1"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_040"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 2},
-        ),
-        Operation(
-            operation_id="T103",
-            job_id="VEHICLE_041",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_4", "Site_6", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_041"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T104",
-            job_id="VEHICLE_041",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_5", "Site_7", "Site_8", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_041"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T105",
-            job_id="VEHICLE_042",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3", "Site_4", "Site_5", "Site_6", "Site_8", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_042"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 5},
-        ),
-        Operation(
-            operation_id="T106",
-            job_id="VEHICLE_042",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_5", "Site_6", "Site_7", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_042"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3},
-        ),
-        Operation(
-            operation_id="T107",
-            job_id="VEHICLE_043",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_4", "Site_5", "Site_7", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_043"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 4},
-        ),
-        Operation(
-            operation_id="T108",
-            job_id="VEHICLE_043",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_4", "Site_6", "Site_7", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_043"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 5},
-        ),
-        Operation(
-            operation_id="T109",
-            job_id="VEHICLE_044",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_5", "Site_6", "Site_8", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_044"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 3},
-        ),
-        Operation(
-            operation_id="T110",
-            job_id="VEHICLE_044",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3", "Site_4", "Site_5", "Site_7", "Site_8", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_044"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 4},
-        ),
-        Operation(
-            operation_id="T111",
-            job_id="VEHICLE_045",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_5", "Site_6", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_045"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 5},
-        ),
-        Operation(
-            operation_id="T112",
-            job_id="VEHICLE_045",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_6", "Site_7", "Site_8", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_045"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 3},
-        ),
-        Operation(
-            operation_id="T113",
-            job_id="VEHICLE_046",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_4", "Site_5", "Site_6", "Site_7", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_046"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 4},
-        ),
-        Operation(
-            operation_id="T114",
-            job_id="VEHICLE_046",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3", "Site_4", "Site_5", "Site_6", "Site_8", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_046"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 5},
-        ),
-        Operation(
-            operation_id="T115",
-            job_id="VEHICLE_047",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_5", "Site_7", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_047"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 3},
-        ),
-        Operation(
-            operation_id="T116",
-            job_id="VEHICLE_047",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_4", "Site_6", "Site_7", "Site_8", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_047"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 4},
-        ),
-        Operation(
-            operation_id="T117",
-            job_id="VEHICLE_048",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_4", "Site_5", "Site_6", "Site_8", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_048"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 5},
-        ),
-        Operation(
-            operation_id="T118",
-            job_id="VEHICLE_048",
-            duration=timedelta(hours=2.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_5", "Site_6", "Site_7", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_048"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "D", "priority": 3},
-        ),
-        Operation(
-            operation_id="T119",
-            job_id="VEHICLE_049",
-            duration=timedelta(hours=1.25).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_3", "Site_4", "Site_5", "Site_6", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_049"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "E", "priority": 4},
-        ),
-        Operation(
-            operation_id="T120",
-            job_id="VEHICLE_049",
-            duration=timedelta(hours=1.5).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_4", "Site_6", "Site_7", "Site_8", "Site_9"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_049"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "A", "priority": 5},
-        ),
-        Operation(
-            operation_id="T121",
-            job_id="VEHICLE_050",
-            duration=timedelta(hours=1.0).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_2", "Site_3", "Site_4", "Site_5", "Site_7", "Site_8", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_050"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "B", "priority": 3},
-        ),
-        Operation(
-            operation_id="T122",
-            job_id="VEHICLE_050",
-            duration=timedelta(hours=1.75).total_seconds(),
-            resource_requirements=[
-                {"resource_type": "site", "possible_resource_ids": ["Site_1", "Site_2", "Site_3", "Site_4", "Site_6", "Site_7", "Site_9", "Site_10"]},
-                {"resource_type": "vehicle", "possible_resource_ids": ["VEHICLE_050"]},
-            ],
-            precedence=[],
-            metadata={"test_type": "C", "priority": 4},
-        ),
-    ])
-
-    tests = generate_sampled_tests(
-        base_tests=tests,
-        pool_size=int(SCHEDULE_CONFIG.get("random_test_pool_size", 500)),
-        sample_size=int(SCHEDULE_CONFIG.get("selected_test_count", 120)),
-        seed=SCHEDULE_CONFIG.get("random_test_seed"),
-    )
-
-    for op in tests:
-        op.metadata["label"] = op.operation_id
-
-    # Jobs are vehicles; group operations by job_id so test additions stay maintenance-free.
-    tests_by_job_id = defaultdict(list)
-    for op in tests:
-        tests_by_job_id[op.job_id].append(op) 
-
-    for job_ops in tests_by_job_id.values():
-        job_ops.sort(key=lambda op: int(op.operation_id.replace("T", "")))
-
-    for vehicle in vehicles:
-        job_id = vehicle.resource_id
-        if not tests_by_job_id.get(job_id):
-            continue
-        schedule.add_job(
-            Job(
-                job_id,
-                tests_by_job_id[job_id],
-                metadata={"vehicle": job_id.replace("VEHICLE_", "V")},
-            )
-        )
-
-    shift_windows = {
-        shift_name: (time(start_h, start_m), time(end_h, end_m))
-        for shift_name, ((start_h, start_m), (end_h, end_m)) in CONSTRAINT_CONFIG["shift_windows"].items()
-    }
-    schedule.add_constraint(
-        ShiftConstraint(
-            shift_windows=list(shift_windows.values()),
-            mode=CONSTRAINT_CONFIG["shift_mode"],
-            resource_type_filter=CONSTRAINT_CONFIG["shift_resource_type_filter"],
-        )
-    )
-
-    # Changeover at sites when switching vehicles (no changeover when same vehicle)
-    schedule.add_constraint(
-        ChangeoverConstraint(
-            changeover_minutes=CONSTRAINT_CONFIG["site_changeover_minutes"],
-            key_from="assigned_resource",
-            key_field="vehicle",
-            resource_type_filter=["site"],
-        )
-    )
-
-    # Transfer time between sites for the same vehicle
-    schedule.add_constraint(
-        ChangeoverConstraint(
-            changeover_minutes=CONSTRAINT_CONFIG["vehicle_transfer_minutes"],
-            key_from="assigned_resource",
-            key_field="site",
-            resource_type_filter=["vehicle"],
-        )
-    )
-
-    # Soak lag for specific tests only (via metadata, e.g. soak_hours).
-    if CONSTRAINT_CONFIG["enable_soak_constraint"]:
-        schedule.add_constraint(SoakConstraint())
+    for constraint in _build_constraints():
+        schedule.add_constraint(constraint)
 
     return schedule, tests, sites, vehicles, start_date, end_date
@@ -8,6 +8,7 @@ weights/bias, optimizing schedule strategy score directly.
 import argparse
 import json
 import os
+from operator import itemgetter
 import sys
 from statistics import mean
 from typing import Dict, List, Tuple
@@ -192,7 +193,7 @@ def main():
             )
             scored.append((avg_score, theta, details))
 
-        scored.sort(key=lambda item: item[0], reverse=True)
+        scored.sort(key=itemgetter(0), reverse=True)
         elites = scored[:elite_k]
         elite_thetas = np.stack([item[1] for item in elites], axis=0)
 